@@ -37,10 +37,17 @@ def _path_from_env(var_name: str) -> Path | None:
 
 def _find_executable(names: tuple[str, ...]) -> Path | None:
     for directory in _native_search_directories():
+        # One directory listing instead of a stat per candidate name; normcase keeps
+        # Windows matching case-insensitive like Path.is_file() was.
+        try:
+            with os.scandir(directory) as entries:
+                present = {os.path.normcase(e.name): e.path for e in entries if e.is_file()}
+        except OSError:
+            continue
         for name in names:
-            path = directory / name
-            if path.is_file():
-                return path
+            found = present.get(os.path.normcase(name))
+            if found:
+                return Path(found)
 
     for name in names:
         found = shutil.which(name)
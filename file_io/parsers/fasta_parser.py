@@ -14,11 +14,14 @@ class FASTAParser(SequenceParser):
         """Yield (header, sequence) pairs without loading the whole file into RAM."""
         path = Path(path)
         try:
-            from Bio import SeqIO
-            for record in SeqIO.parse(str(path), 'fasta'):
-                yield record.description, str(record.seq).upper()
+            from Bio.SeqIO.FastaIO import SimpleFastaParser
         except ImportError:
             yield from self._parse_custom(path)
+            return
+        # SimpleFastaParser SeqRecord/Seq nesnesi kurmaz; başlık record.description ile aynıdır
+        with open(path, 'r', encoding='utf-8', errors='replace') as fh:
+            for title, seq in SimpleFastaParser(fh):
+                yield title, seq.upper()
 
     def _parse_custom(self, path: Path) -> Iterator[tuple[str, str]]:
         """Minimal FASTA parser that streams line-by-line without BioPython."""
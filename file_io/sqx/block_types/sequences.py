@@ -4,7 +4,7 @@ from __future__ import annotations
 import struct
 import uuid as _uuid_mod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable
 
 from file_io.sqx.spec import (
     ENCODING_IUPAC4,
@@ -209,32 +209,32 @@ class SequenceBlockEntry:
 
 
 def serialize_sequences_block(
-    records: list[SequenceRecord],
+    records: Iterable[SequenceRecord],
     source_file: str = "",
-) -> bytes:
-    """Build the complete SEQUENCES block content (directory + records)."""
-    n = len(records)
-    dir_header_size = 4 + n * 40  # seq_count(4) + n × (uuid16 + offset8 + length8 + bases8)
-
-    dir_entries: list[tuple[bytes, int, int, int]] = []
-    record_chunks: list[bytes] = []
-    current_offset = dir_header_size  # running offset within block content
-
+) -> bytearray:
+    """Build the complete SEQUENCES block content (directory + records).
+
+    *records* may be a generator: each record is encoded into the body as it arrives, so
+    the caller never holds every decoded sequence string at once. The directory is
+    packed once the count is known and the body is appended behind it in one copy.
+    """
+    entries: list[tuple[bytes, int, int, int]] = []
+    body = bytearray()
     for rec in records:
         meta_bytes = serialize_record_meta(rec, source_file)
         seq_str: str = rec.sequence if isinstance(rec.sequence, str) else rec.sequence.to_str()  # type: ignore[union-attr]
         encoded = encode_sequence(seq_str)
-        base_count = len(seq_str)
-        data_offset_in_block = current_offset + len(meta_bytes)
-        dir_entries.append((_uuid_to_bytes(rec.id), data_offset_in_block, len(encoded), base_count))
-        record_chunks.append(meta_bytes + encoded)
-        current_offset += len(meta_bytes) + len(encoded)
+        entries.append((_uuid_to_bytes(rec.id), len(body) + len(meta_bytes), len(encoded), len(seq_str)))
+        body += meta_bytes
+        body += encoded
 
-    buf = bytearray()
-    buf += struct.pack('<I', n)
-    for uid_b, data_off, data_len, base_cnt in dir_entries:
-        buf += uid_b
-        buf += struct.pack('<QQQ', data_off, data_len, base_cnt)
-    for chunk in record_chunks:
-        buf += chunk
-    return bytes(buf)
+    n = len(entries)
+    dir_header_size = 4 + n * 40  # seq_count(4) + n × (uuid16 + offset8 + length8 + bases8)
+    buf = bytearray(dir_header_size)
+    struct.pack_into('<I', buf, 0, n)
+    for i, (uid_b, body_offset, data_len, base_cnt) in enumerate(entries):
+        pos = 4 + i * 40
+        buf[pos:pos + 16] = uid_b
+        struct.pack_into('<QQQ', buf, pos + 16, dir_header_size + body_offset, data_len, base_cnt)
+    buf += body
+    return buf
@@ -34,18 +34,23 @@ class SQXVersionError(Exception):
     """Raised when the SQX format version is newer than this reader supports."""
 
 
+# byte → IUPAC4 nibble; lowercase folds to the same nibble, unmapped bytes → N (0xF)
+_NIBBLE_TABLE: bytes = bytes(IUPAC4.get(chr(b).upper(), 0xF) for b in range(256))
+_HIGH_NIBBLE_TABLE: bytes = bytes((b << 4) & 0xFF for b in range(256))
+
+
 def encode_sequence(seq: str) -> bytes:
     """Pack a nucleotide string into 4-bit IUPAC bytes (2 bases per byte, big-nibble first)."""
-    seq = seq.upper()
-    n = len(seq)
-    buf = bytearray((n + 1) // 2)
-    for i, ch in enumerate(seq):
-        nibble = IUPAC4.get(ch, 0xF)   # unknown bases → N
-        if i % 2 == 0:
-            buf[i // 2] = nibble << 4
-        else:
-            buf[i // 2] |= nibble
-    return bytes(buf)
+    if not seq.isascii():
+        seq = seq.upper()
+    # Case folding and IUPAC mapping in one bytes.translate; nibble pairs are packed
+    # by OR-ing two big ints, so there is no per-character Python loop.
+    nibbles = seq.encode('ascii', 'replace').translate(_NIBBLE_TABLE)
+    if len(nibbles) % 2:
+        nibbles += b'\x00'
+    high = nibbles[0::2].translate(_HIGH_NIBBLE_TABLE)
+    packed = int.from_bytes(high, 'big') | int.from_bytes(nibbles[1::2], 'big')
+    return packed.to_bytes(len(high), 'big')
 
 
 def decode_sequence(data: bytes | bytearray | memoryview, base_count: int) -> str:
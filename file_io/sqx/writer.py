@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import struct
 from pathlib import Path
+from typing import Iterable
 
 from file_io.sqx.spec import (
     APP_VERSION,
@@ -25,12 +26,15 @@ class SQXWriter:
     def write(
         self,
         path: str | Path,
-        records: list[SequenceRecord],
+        records: Iterable[SequenceRecord],
         meta: ProjectMeta,
         analyses: list[AnalysisEntry] | None = None,
         source_file: str = "",
     ) -> None:
-        """Serialise *records* + *meta* (and optionally *analyses*) to *path*."""
+        """Serialise *records* + *meta* (and optionally *analyses*) to *path*.
+
+        *records* is consumed once and may be a generator.
+        """
         analyses = analyses or []
         path = Path(path)
 
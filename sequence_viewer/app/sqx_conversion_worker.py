@@ -1,6 +1,7 @@
 # sequence_viewer/app/sqx_conversion_worker.py
 from __future__ import annotations
 
+import itertools
 from pathlib import Path
 
 from PyQt5.QtCore import QThread, pyqtSignal
@@ -76,13 +77,16 @@ class SQXConversionWorker(QThread):
         from file_io.sqx.writer import SQXWriter
         from sequence_viewer.model.sequence_record import SequenceRecord
 
-        records = [
+        # Stream records into the writer so decoded sequence strings are not all held at once
+        records = (
             SequenceRecord(header=h, sequence=s)
             for h, s in FASTAParser().parse(self._fasta_path)
-        ]
-        if not records:
+        )
+        first = next(records, None)
+        if first is None:
             self.failed.emit("Dosyada sequence bulunamadi.")
             return
+        records = itertools.chain((first,), records)
 
         SQXWriter().write(
             self._sqx_path,
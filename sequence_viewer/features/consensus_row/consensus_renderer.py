@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from itertools import groupby
 
 from PyQt5.QtCore import QPointF, QRectF, Qt
 from PyQt5.QtGui import QBrush, QColor, QFont, QPainter, QPen
@@ -113,18 +114,17 @@ class ConsensusRenderer:
         box_ref = min(seq_char_h * 0.7, font_pt)
         box_h = max(box_ref, 1.0)
         box_y = seq_top + (seq_char_h - box_h) / 2.0
-        for j, base in enumerate(consensus_slice):
-            base_u = consensus_upper[j]
-            col = start_col + j
-            x = col * char_width - view_left
-            selected = sel_mask is not None and sel_mask[j]
-            color = QColor(255, 255, 255) if selected else widget._color_map.get(base_u, theme.text_primary)
-            if mode == "box":
-                painter.setBrush(QBrush(color))
-                painter.setPen(Qt.NoPen)
-                painter.drawRect(QRectF(x, box_y, char_width, box_h))
-            else:
-                glyph = GLYPH_CACHE.get_glyph(base, widget._font, color)
+        if mode == "box":
+            self._render_box_runs(
+                painter, widget, theme, consensus_upper, sel_mask, start_col, char_width, view_left, box_y, box_h
+            )
+        else:
+            glyphs = GLYPH_CACHE.get_subcache(GLYPH_CACHE.font_key(widget._font))
+            for j, base in enumerate(consensus_slice):
+                x = (start_col + j) * char_width - view_left
+                selected = sel_mask is not None and sel_mask[j]
+                color = QColor(255, 255, 255) if selected else widget._color_map.get(consensus_upper[j], theme.text_primary)
+                glyph = GLYPH_CACHE.get_glyph(base, widget._font, color, glyphs)
                 dx = x + (char_width - glyph.width()) / 2.0
                 dy = seq_top + (seq_char_h - glyph.height()) / 2.0
                 painter.drawPixmap(int(dx), int(dy), glyph)
@@ -136,6 +136,28 @@ class ConsensusRenderer:
         self._render_guides(painter, widget, char_width, seq_top, seq_char_h)
         return hit_rects
 
+    def _render_box_runs(self, painter, widget, theme, consensus_upper, sel_mask, start_col, char_width, view_left, box_y, box_h):
+        # Aynı baz + seçim durumundaki ardışık sütunlar tek geniş rect olur; rect'ler
+        # renge göre toplanıp her renk için tek drawRects çağrısıyla basılır.
+        painter.setPen(Qt.NoPen)
+        flags = sel_mask if sel_mask is not None else bytes(len(consensus_upper))
+        white = QColor(255, 255, 255)
+        color_map = widget._color_map
+        fallback = theme.text_primary
+        groups: dict = {}  # rgba -> (QColor, [QRectF, ...])
+        j = 0
+        for (base_u, selected), run in groupby(zip(consensus_upper, flags)):
+            n = sum(1 for _ in run)
+            color = white if selected else color_map.get(base_u, fallback)
+            entry = groups.get(color.rgba())
+            if entry is None:
+                entry = groups[color.rgba()] = (color, [])
+            entry[1].append(QRectF((start_col + j) * char_width - view_left, box_y, n * char_width, box_h))
+            j += n
+        for color, rects in groups.values():
+            painter.setBrush(QBrush(color))
+            painter.drawRects(rects)
+
     def _render_line_mode(self, painter, theme, start_col, end_col, char_width, view_left, width, seq_top, seq_char_h, selection_ranges):
         line_h = seq_char_h * 0.3
         y = seq_top + (seq_char_h - line_h) / 2.0
@@ -6,39 +6,68 @@ MODIFIED:
 """
 from __future__ import annotations
 from typing import Optional
-from PyQt5.QtCore import Qt, pyqtSignal, QRectF
-from PyQt5.QtGui import QPainter, QPen, QBrush, QFont, QColor
+from PyQt5.QtCore import Qt, pyqtSignal, QPointF, QRectF
+from PyQt5.QtGui import (
+    QPainter, QPen, QBrush, QFont, QColor, QPixmap, QFontMetrics, QStaticText, QTransform,
+)
 from PyQt5.QtWidgets import QWidget, QLineEdit
 from settings.bindings.mouse import mouse_binding_manager, MouseAction
 from settings.sequence_viewer.theme import theme_manager
 
-class HeaderTopWidget(QWidget):
-    def __init__(self, height=28, parent=None):
+class _PixmapCachedWidget(QWidget):
+    """Static spacer: content is rendered once into a QPixmap and blitted on expose.
+
+    The cache is dropped on resize and theme change; subclasses implement _render().
+    """
+    def __init__(self, height, parent=None):
         super().__init__(parent); self.setFixedHeight(height)
-        theme_manager.themeChanged.connect(lambda _: self.update())
+        self._cache: Optional[QPixmap] = None
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAutoFillBackground(False)
+        theme_manager.themeChanged.connect(lambda _: self._invalidate_cache())
+    def _invalidate_cache(self):
+        self._cache = None; self.update()
+    def resizeEvent(self, event):
+        self._cache = None; super().resizeEvent(event)
+    def _render(self, painter, rect): raise NotImplementedError
     def paintEvent(self, event):
-        painter = QPainter(self); t = theme_manager.current
-        painter.fillRect(self.rect(), QBrush(t.ruler_bg))
+        dpr = self.devicePixelRatioF()
+        if self._cache is None or self._cache.size() != self.size() * dpr:
+            cache = QPixmap(self.size() * dpr); cache.setDevicePixelRatio(dpr)
+            p = QPainter(cache); self._render(p, self.rect()); p.end()
+            self._cache = cache
+        # Ekran painter'ı kapsam sonunda ~QPainter ile kapanır; pixmap painter'ı ise kullanılmadan önce end() ister.
+        QPainter(self).drawPixmap(0, 0, self._cache)
+
+class HeaderTopWidget(_PixmapCachedWidget):
+    def __init__(self, height=28, parent=None):
+        super().__init__(height, parent)
+    def _render(self, painter, rect):
+        t = theme_manager.current
+        painter.fillRect(rect, QBrush(t.ruler_bg))
         painter.setPen(QPen(t.ruler_border))
-        painter.drawLine(0, self.rect().bottom()-1, self.rect().right(), self.rect().bottom()-1)
-        painter.end()
+        painter.drawLine(0, rect.bottom()-1, rect.right(), rect.bottom()-1)
 
-class HeaderPositionSpacerWidget(QWidget):
+class HeaderPositionSpacerWidget(_PixmapCachedWidget):
     def __init__(self, height=24, parent=None):
-        super().__init__(parent); self.setFixedHeight(height)
-        theme_manager.themeChanged.connect(lambda _: self.update())
-    def paintEvent(self, event):
-        painter = QPainter(self); t = theme_manager.current; rect = self.rect()
+        super().__init__(height, parent)
+        # Sabit etiket: glyph layout bir kez hazırlanır, her render'da yeniden şekillendirilmez.
+        self._label_font = QFont("Arial", 9)
+        self._label_height = QFontMetrics(self._label_font).height()
+        self._label = QStaticText("Header"); self._label.setTextFormat(Qt.PlainText)
+        self._label.prepare(QTransform(), self._label_font)
+    def _render(self, painter, rect):
+        t = theme_manager.current
         painter.fillRect(rect, QBrush(t.ruler_bg))
-        font = QFont("Arial", 9); painter.setFont(font); painter.setPen(QPen(t.ruler_fg))
-        painter.drawText(rect.adjusted(6,0,0,0), Qt.AlignVCenter|Qt.AlignLeft, "Header")
+        painter.setFont(self._label_font); painter.setPen(QPen(t.ruler_fg))
+        painter.drawStaticText(QPointF(rect.left()+6, rect.top()+(rect.height()-self._label_height)/2.0), self._label)
         painter.setPen(QPen(t.ruler_border))
         painter.drawLine(rect.left(), rect.bottom()-1, rect.right(), rect.bottom()-1)
-        painter.end()
 
 class AnnotationSpacerWidget(QWidget):
     def __init__(self, height=24, parent=None):
         super().__init__(parent); self.setFixedHeight(height)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)  # paintEvent tüm alanı doldurur
         theme_manager.themeChanged.connect(lambda _: self.update())
     def sync_height(self, height):
         if self.height() != height: self.setFixedHeight(height)
@@ -50,7 +79,6 @@ class AnnotationSpacerWidget(QWidget):
         painter.drawText(rect.adjusted(6,0,0,0), Qt.AlignVCenter|Qt.AlignLeft, "Annotations")
         painter.setPen(QPen(t.border_normal))
         painter.drawLine(rect.left(), rect.bottom()-1, rect.right(), rect.bottom()-1)
-        painter.end()
 
 class ConsensusSpacerWidget(QWidget):
     """
@@ -66,6 +94,7 @@ class ConsensusSpacerWidget(QWidget):
     def __init__(self, height=20, parent=None):
         super().__init__(parent)
         self.setFixedHeight(height)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)  # paintEvent tüm alanı doldurur
         self._char_height = height
         self._above_h = 0  # annotation lane yüksekliĞŸi (üstte)
         self._label = "Consensus"
@@ -118,7 +147,6 @@ class ConsensusSpacerWidget(QWidget):
         painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, self._label)
         painter.setPen(QPen(t.border_normal))
         painter.drawLine(rect.left(), rect.bottom()-1, rect.right(), rect.bottom()-1)
-        painter.end()
 
     def mousePressEvent(self, event):
         action = mouse_binding_manager.resolve_consensus_spacer_click(event.modifiers(), event.button())
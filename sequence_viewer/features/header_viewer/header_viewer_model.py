@@ -1,20 +1,25 @@
 # sequence_viewer/features/header_viewer/header_viewer_model.py
-from typing import List
+import sys
+from typing import List, Optional, Sequence, Tuple
 
 class HeaderViewerModel:
-    def __init__(self): self._headers: List[str] = []
+    """Header metinleri; tekrarlanan isimler sys.intern ile tek kopya tutulur."""
+    def __init__(self):
+        self._headers: List[str] = []
+        self._headers_view: Optional[Tuple[str, ...]] = None  # mutasyonda sıfırlanır
     def add_header(self, text):
-        self._headers.append(text); return len(self._headers) - 1
+        self._headers.append(sys.intern(text)); self._headers_view = None
+        return len(self._headers) - 1
     def set_headers(self, headers):
-        self._headers = list(headers)
+        self._headers = [sys.intern(h) for h in headers]; self._headers_view = None
     def set_header(self, index, text):
         if index < 0 or index >= len(self._headers):
             raise IndexError(f"Header index {index} out of range")
-        self._headers[index] = text
+        self._headers[index] = sys.intern(text); self._headers_view = None
     def remove_header(self, index):
         if index < 0 or index >= len(self._headers):
             raise IndexError(f"Header index {index} out of range")
-        del self._headers[index]
+        del self._headers[index]; self._headers_view = None
     def move_header(self, from_index: int, to_index: int):
         n = len(self._headers)
         if not (0 <= from_index < n and 0 <= to_index < n):
@@ -22,8 +27,17 @@ class HeaderViewerModel:
         if from_index == to_index:
             return
         h = self._headers.pop(from_index)
-        self._headers.insert(to_index, h)
-    def clear_headers(self): self._headers.clear()
-    def get_headers(self): return list(self._headers)
+        self._headers.insert(to_index, h); self._headers_view = None
+    def clear_headers(self): self._headers.clear(); self._headers_view = None
+    def get_headers(self):
+        """Deprecated: mutable kopya döner; salt okuma için iter_headers / get_headers_view kullanın."""
+        return list(self._headers)
+    def iter_headers(self): return iter(self._headers)
+    def __iter__(self): return iter(self._headers)
+    def __len__(self): return len(self._headers)
+    def get_headers_view(self) -> Sequence[str]:
+        if self._headers_view is None:
+            self._headers_view = tuple(self._headers)
+        return self._headers_view
     def get_row_count(self): return len(self._headers)
     def get_header(self, index): return self._headers[index]
@@ -3,9 +3,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QBrush, QFontMetrics, QPainter
-from PyQt5.QtWidgets import QGraphicsScene, QGraphicsView
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QBrush, QFont, QFontMetrics, QPainter
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsView
 
 from sequence_viewer.features.header_viewer.header_drag_controller import HeaderDragController
 from sequence_viewer.features.header_viewer.header_inline_editor import HeaderInlineEditor
@@ -14,6 +14,7 @@ from sequence_viewer.features.header_viewer.header_selection_handler import (
     HeaderSelectionHandler,
 )
 from sequence_viewer.graphics.header_item.header_item import HeaderRowItem
+from sequence_viewer.graphics.header_item.header_item_model import HeaderRowModel
 from sequence_viewer.model.row_selection_model import RowSelectionModel
 from settings.bindings.mouse import MouseAction, mouse_binding_manager
 from settings.sequence_viewer.theme import theme_manager
@@ -28,6 +29,9 @@ class HeaderViewerView(QGraphicsView):
     def __init__(self, parent=None, *, row_height=18.0, initial_width=160.0):
         super().__init__(parent)
         self.scene = QGraphicsScene(self)
+        # Pooled rows sit in one column and are re-positioned on every remount; a BSP
+        # index buys nothing for hit-testing here and would be rebuilt on each setPos.
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
         self._char_height = int(round(row_height))
         self._annot_height = 0
@@ -37,11 +41,26 @@ class HeaderViewerView(QGraphicsView):
         self.header_items: list[HeaderRowItem] = []  # item pool
         self._total_header_count: int = 0
         self._pool_first_row: int = 0
+        # Row window the pool was last synced to; None forces the next sync to run.
+        self._pool_window: tuple[int, int] | None = None
+        # Header text width cache: metrics are rebuilt only on font change and
+        # the widest text is tracked incrementally (None = stale, rebuild lazily).
+        self._font_metrics: QFontMetrics | None = None
+        self._max_full_text_px: int | None = 0
+        # Resize bursts (splitter drags) are coalesced into one pass per event-loop turn.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._apply_pending_resize)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         from PyQt5.QtWidgets import QFrame
         self.setFrameShape(QFrame.NoFrame)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+        # HeaderRowItem ve drop indicator tüm painter durumunu kendisi kurar
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
         self.setMinimumWidth(60)
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
@@ -93,6 +112,9 @@ class HeaderViewerView(QGraphicsView):
     def _get_header_text_for_row(self, row_idx: int) -> str:
         return ''
 
+    def _iter_header_texts(self):
+        return (self._get_header_text_for_row(i) for i in range(self._total_header_count))
+
     def _ensure_header_pool_size(self, needed: int) -> None:
         while len(self.header_items) < needed:
             item_width = self.viewport().width() or self.header_width
@@ -103,6 +125,8 @@ class HeaderViewerView(QGraphicsView):
                 annot_height=0,
                 row_index=0,
             )
+            # Row text is re-rasterized only when the item calls update().
+            item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
             item.setVisible(False)
             self.scene.addItem(item)
             self.header_items.append(item)
@@ -131,7 +155,7 @@ class HeaderViewerView(QGraphicsView):
         if self._total_header_count == 0:
             return
         first, last = self._desired_pool_window()
-        if last < first:
+        if last < first or (first, last) == self._pool_window:
             return
         needed = last - first + 1
         self._ensure_header_pool_size(needed)
@@ -149,11 +173,13 @@ class HeaderViewerView(QGraphicsView):
                 break
             self._mount_header_item(free.pop(), row)
         self._pool_first_row = first
+        self._pool_window = (first, last)
 
     def _full_header_pool_remount(self) -> None:
         if self._total_header_count == 0:
             for item in self.header_items:
                 item.setVisible(False)
+            self._pool_window = None
             return
         first, last = self._desired_pool_window()
         needed = max(last - first + 1, 0)
@@ -165,6 +191,25 @@ class HeaderViewerView(QGraphicsView):
             else:
                 item.setVisible(False)
         self._pool_first_row = first
+        self._pool_window = (first, last)
+
+    def _header_font_metrics(self) -> QFontMetrics:
+        if self._font_metrics is None:
+            font = QFont("Arial")
+            font.setPointSizeF(
+                HeaderRowModel(full_text='', row_height=self._char_height).compute_font_point_size()
+            )
+            self._font_metrics = QFontMetrics(font)
+        return self._font_metrics
+
+    def _max_header_text_px(self) -> int:
+        if self._max_full_text_px is None:
+            metrics = self._header_font_metrics()
+            self._max_full_text_px = max(
+                map(metrics.horizontalAdvance, self._iter_header_texts()),
+                default=0,
+            )
+        return self._max_full_text_px
 
     def _find_pool_item(self, row_idx: int) -> HeaderRowItem | None:
         for item in self.header_items:
@@ -203,7 +248,12 @@ class HeaderViewerView(QGraphicsView):
 
     def add_header_item(self, display_text: str) -> None:
         self._total_header_count += 1
+        self._pool_window = None
         row_idx = self._total_header_count - 1
+        if self._max_full_text_px is not None:
+            text_px = self._header_font_metrics().horizontalAdvance(display_text)
+            if text_px > self._max_full_text_px:
+                self._max_full_text_px = text_px
         _, last = self._desired_pool_window()
         if row_idx <= last:
             self._ensure_header_pool_size(len(self.header_items) + 1)
@@ -217,7 +267,9 @@ class HeaderViewerView(QGraphicsView):
         self.scene.clear()
         self._total_header_count = 0
         self._pool_first_row = 0
+        self._pool_window = None
         self._row_layout = None
+        self._max_full_text_px = 0
         self._update_scene_rect()
 
     def apply_selection_to_items(self, changed_rows):
@@ -238,20 +290,23 @@ class HeaderViewerView(QGraphicsView):
         self.scene.setSceneRect(0, 0, float(width), height)
 
     def compute_required_width(self):
-        if not self.header_items:
+        if self._total_header_count == 0:
             return 100
-        metrics = QFontMetrics(self.header_items[0].font)
-        max_px = max(metrics.horizontalAdvance(item.full_text) for item in self.header_items)
-        return max_px + 6 + 4 + 4
+        return self._max_header_text_px() + 6 + 4 + 4
 
     # ── Resize / scroll ────────────────────────────────────────────────────
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self._resize_timer.start()
+
+    def _apply_pending_resize(self):
         width = self.viewport().width()
         for item in self.header_items:
             item.set_width(width)
         self._update_scene_rect()
+        # A taller viewport widens the row window; mount the newly exposed rows.
+        self._sync_header_pool()
         if self.header_items:
             required = self.compute_required_width()
             self.setMaximumWidth(required if width >= required else 16_777_215)
@@ -283,6 +338,8 @@ class HeaderViewerView(QGraphicsView):
         if self._char_height == new_char_height:
             return
         self._char_height = new_char_height
+        self._font_metrics = None
+        self._max_full_text_px = None
         for item in self.header_items:
             item.set_row_height(new_char_height)
         self._update_scene_rect()
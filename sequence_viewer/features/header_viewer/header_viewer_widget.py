@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from PyQt5.QtCore import pyqtSignal
-from PyQt5.QtGui import QFont, QFontMetrics
 
 from .header_viewer_model import HeaderViewerModel
 from .header_viewer_view import HeaderViewerView
@@ -17,14 +16,15 @@ class HeaderViewerWidget(HeaderViewerView):
     def __init__(self, parent=None, *, row_height=18.0, initial_width=160.0):
         super().__init__(parent=parent, row_height=row_height, initial_width=initial_width)
         self._model = HeaderViewerModel()
-        self._max_header_text_px = 0
-        self._required_width_cache = 100
 
     # ── Pool data provider ─────────────────────────────────────────────────
 
     def _get_header_text_for_row(self, row_idx: int) -> str:
         return f"{row_idx + 1}. {self._model.get_header(row_idx)}"
 
+    def _iter_header_texts(self):
+        return (f"{i}. {h}" for i, h in enumerate(self._model.iter_headers(), start=1))
+
     # ── Signal forwarding ──────────────────────────────────────────────────
 
     def _on_edit_committed(self, row_index, new_text): self.headerEdited.emit(row_index, new_text)
@@ -36,9 +36,7 @@ class HeaderViewerWidget(HeaderViewerView):
 
     def add_header(self, text: str) -> None:
         row_index = self._model.add_header(text)
-        display_text = f"{row_index + 1}. {text}"
-        self._include_header_width(display_text)
-        self.add_header_item(display_text)
+        self.add_header_item(f"{row_index + 1}. {text}")
 
     def set_headers(self, headers) -> None:
         self._model.set_headers(headers)
@@ -47,16 +45,16 @@ class HeaderViewerWidget(HeaderViewerView):
         self._editor.cancel_edit()
         self._drag.reset()
         self._full_header_pool_remount()
-        self._rebuild_width_cache()
+        self._invalidate_width_cache()
         self._update_scene_rect()
 
     def clear(self):
         self._model.clear_headers()
-        self._max_header_text_px = 0
-        self._required_width_cache = 100
         self.clear_items()
 
     def get_headers(self): return self._model.get_headers()
+    def get_headers_view(self): return self._model.get_headers_view()
+    def iter_headers(self): return self._model.iter_headers()
     def get_row_count(self): return self._model.get_row_count()
 
     def selected_rows(self):
@@ -142,41 +140,11 @@ class HeaderViewerWidget(HeaderViewerView):
             item.set_full_text(display_text)
 
     def compute_required_width(self) -> int:
-        if self._required_width_cache is not None:
-            return self._required_width_cache
-        return self._rebuild_width_cache()
+        return max(100, super().compute_required_width())
 
     def _on_display_settings_changed(self):
         super()._on_display_settings_changed()
         self._invalidate_width_cache()
 
-    def _font_metrics(self) -> QFontMetrics:
-        font = self.header_items[0].font if self.header_items else QFont("Arial")
-        return QFontMetrics(font)
-
-    def _include_header_width(self, display_text: str) -> None:
-        if self._required_width_cache is None:
-            self._rebuild_width_cache()
-        metrics = self._font_metrics()
-        self._max_header_text_px = max(
-            self._max_header_text_px,
-            metrics.horizontalAdvance(display_text),
-        )
-        self._required_width_cache = max(100, self._max_header_text_px + 14)
-
     def _invalidate_width_cache(self) -> None:
-        self._required_width_cache = None
-
-    def _rebuild_width_cache(self) -> int:
-        headers = self._model.get_headers()
-        if not headers:
-            self._max_header_text_px = 0
-            self._required_width_cache = 100
-            return self._required_width_cache
-        metrics = self._font_metrics()
-        self._max_header_text_px = max(
-            metrics.horizontalAdvance(f"{i + 1}. {h}")
-            for i, h in enumerate(headers)
-        )
-        self._required_width_cache = max(100, self._max_header_text_px + 14)
-        return self._required_width_cache
+        self._max_full_text_px = None
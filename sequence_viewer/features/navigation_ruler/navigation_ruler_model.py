@@ -2,11 +2,16 @@
 # features/navigation_ruler/navigation_ruler_model.py
 from dataclasses import dataclass
 from typing import List, Sequence, Optional
-import math
+import numpy as np
+
+_POW10 = [10**k for k in range(21)]
 
 @dataclass
 class NavigationTickLayout:
-    max_len: int; tick_step: int; major_ticks: List[int]; minor_ticks: List[int]
+    max_len: int; tick_step: int; major_ticks: List[int]; minor_ticks: Sequence[int]
+    # pixel_width'e izdüşürülmüş x koordinatları (int32); widget tick başına bölme yapmaz
+    major_x: Optional[np.ndarray] = None; minor_x: Optional[np.ndarray] = None
+    major_labels: Optional[List[str]] = None  # major_ticks ile aynı sırada; 0 → "1"
 
 class NavigationRulerModel:
     def __init__(self): self._cached_max_len = 0; self._last_seq_count = 0
@@ -23,15 +28,34 @@ class NavigationRulerModel:
         max_nt = self._cached_max_len
         if max_nt <= 0 or pixel_width <= 0: return None
         step = self._nice_tick_step(max_nt, pixel_width, target_px)
-        minor_step = max(step//5, 1)
-        minor_ticks = list(range(0, max_nt+1, minor_step))
+        # Alt-piksel minor tick üretme: adım en az bir piksele karşılık gelir, sayı ≤ pixel_width+1
+        minor_step = max(step//5, 1, -(-max_nt // pixel_width))
+        minor_ticks = np.arange(0, max_nt+1, minor_step, dtype=np.int64)
         major_ticks = list(range(0, max_nt+1, step))
         if major_ticks:
             delta = max_nt - major_ticks[-1]
             if delta != 0:
                 if delta < step*0.5: major_ticks[-1] = max_nt
                 else: major_ticks.append(max_nt)
-        return NavigationTickLayout(max_len=max_nt, tick_step=step, major_ticks=major_ticks, minor_ticks=minor_ticks)
+        return NavigationTickLayout(max_len=max_nt, tick_step=step, major_ticks=major_ticks, minor_ticks=minor_ticks,
+                                    major_x=self._project(np.asarray(major_ticks, dtype=np.int64), max_nt, pixel_width),
+                                    minor_x=self._project(minor_ticks, max_nt, pixel_width),
+                                    major_labels=[self.format_label(1 if tick == 0 else tick) for tick in major_ticks])
+
+    @staticmethod
+    def _project(ticks, max_nt, pixel_width):
+        """floor(nt*width/max_nt); int64 tam sayı aritmetiği, float ara dizi ve kesme hatası yok."""
+        return (ticks * pixel_width // max_nt).astype(np.int32)
+
+    def nt_range_to_px(self, nt_a, nt_b, pixel_width):
+        """[nt_a, nt_b] aralığını [0, max_len]'e kırpıp ruler piksellerine izdüşürür; boşsa None."""
+        max_nt = self._cached_max_len
+        if max_nt <= 0 or pixel_width <= 0: return None
+        if nt_a > nt_b: nt_a, nt_b = nt_b, nt_a
+        a = max(0.0, nt_a); b = min(float(max_nt), nt_b)
+        if b <= a: return None
+        scale = pixel_width / max_nt
+        return int(a*scale), int(b*scale)
 
     def format_label(self, value):
         if value == 1: return "1"
@@ -46,10 +70,12 @@ class NavigationRulerModel:
     def _nice_tick_step(max_nt, pixel_width, target_px=60):
         if max_nt <= 0 or pixel_width <= 0: return max(max_nt, 1)
         raw = (max_nt*target_px)/float(pixel_width)
-        if raw <= 0: return 1
-        power = 10**int(math.floor(math.log10(raw)))
+        # Adım tam sayı nt; 1'in altındaki ham adım 1'e yuvarlanır (aksi halde int(nice*power) 0 olurdu)
+        if raw <= 1: return 1
+        # Onluk basamak log10 yerine bit_length'ten: log10(2) ≈ 1233/4096, en fazla bir düzeltme
+        raw_int = int(raw); decade = ((raw_int.bit_length() - 1) * 1233) >> 12
+        if raw_int >= _POW10[decade + 1]: decade += 1
+        power = _POW10[decade]
         base = raw/power
         nice = 1 if base <= 1 else 2 if base <= 2 else 5 if base <= 5 else 10
-        return int(nice*power)
-
-
+        return nice*power
@@ -1,7 +1,8 @@
 # sequence_viewer/features/navigation_ruler/navigation_ruler_widget.py
 # features/navigation_ruler/navigation_ruler_widget.py
 from typing import Optional
-from PyQt5.QtCore import Qt, QRectF
+from collections import OrderedDict
+from PyQt5.QtCore import Qt, QRectF, QLine
 from PyQt5.QtGui import QPainter, QPen, QBrush, QFont, QPixmap
 from PyQt5.QtWidgets import QWidget, QScrollBar
 from sequence_viewer.features.sequence_viewer.sequence_viewer_widget import SequenceViewerWidget
@@ -10,43 +11,86 @@ from settings.bindings.mouse import mouse_binding_manager
 from settings.sequence_viewer.theme import theme_manager
 
 class RulerWidget(QWidget):
+    _PIXMAP_CACHE_MAX = 8
+
     def __init__(self, viewer, parent=None):
         super().__init__(parent); self.viewer = viewer
         self.setMinimumHeight(28); self.setMaximumHeight(28)
         self.font = QFont("Arial", 8); self._model = NavigationRulerModel()
-        hbar = self.viewer.horizontalScrollBar()
-        hbar.valueChanged.connect(self._on_view_changed); hbar.rangeChanged.connect(self._on_view_changed)
+        # Paint/mouse yolunda viewer attribute zinciri ve C++ çağrıları yerine cache'li referanslar
+        hbar = self._hbar = self.viewer.horizontalScrollBar(); self._viewport = self.viewer.viewport()
+        self._scene_width = int(self.viewer.scene.sceneRect().width())  # piksel; overlay tam sayı aritmetiği
+        self.viewer.scene.sceneRectChanged.connect(self._on_scene_rect_changed)
+        hbar.valueChanged.connect(self._on_scroll_value_changed); hbar.rangeChanged.connect(self._on_view_changed)
         self._dragging_window = False; self._drag_start_x = 0
         self._drag_start_nt = 0.0; self._drag_last_nt = 0.0
-        self._ruler_pixmap = None; self._pixmap_max_len = 0; self._pixmap_theme = ""
+        # (width, height, max_len, theme) → QPixmap; resize sürüklemesinde geri dönülen boyutlar yeniden çizilmez
+        self._ruler_pixmaps: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        # Tema başına bir kez kurulan pen/brush'lar; paint başına QPen/QBrush inşa edilmez
+        self._paint_tools = None
+        self._painted_span = None  # son paint'teki viewport overlay (x1, x2)
         theme_manager.themeChanged.connect(self._on_theme_changed)
 
-    def _on_theme_changed(self, _): self._ruler_pixmap = None; self._pixmap_theme = ""; self.update()
-    def _invalidate_ruler_pixmap(self): self._ruler_pixmap = None; self._pixmap_max_len = 0; self._pixmap_theme = ""; self.update()
+    def _on_theme_changed(self, _): self._paint_tools = None; self._invalidate_ruler_pixmap()
+
+    def _tools_for(self, t):
+        """(bg_brush, border_pen, viewport_brush, viewport_pen, drag_brush, drag_pen)"""
+        tools = self._paint_tools
+        if tools is None or tools[0] is not t:
+            tools = self._paint_tools = (t, (
+                QBrush(t.nav_ruler_bg), QPen(t.ruler_border),
+                QBrush(t.nav_ruler_viewport_fill), QPen(t.nav_ruler_viewport_border),
+                QBrush(t.nav_ruler_drag_fill), QPen(t.nav_ruler_drag_border)))
+        return tools[1]
+    def _invalidate_ruler_pixmap(self): self._ruler_pixmaps.clear(); self.update()
     def _on_view_changed(self, *_): self.update()
+    def _on_scene_rect_changed(self, rect): self._scene_width = int(rect.width()); self.update()
+    def _on_scroll_value_changed(self, *_):
+        # Scroll patlamasında overlay çoğu adımda aynı piksele düşer; yalnızca span değişince boya
+        if self._viewport_span(self.rect().width()) != self._painted_span: self.update()
+
+    def _viewport_span(self, width):
+        """Viewer'ın görünür aralığının ruler'daki (x1, x2) pikselleri; sahne boşsa None."""
+        scene_width = self._scene_width
+        if scene_width <= 0: return None
+        view_left = self._hbar.value(); view_width = self._viewport.width()
+        if scene_width <= view_width: return 0, width
+        # Hepsi tam sayı piksel: float bölme + int() yerine taban bölme
+        return (max(0, min(width, view_left*width // scene_width)),
+                max(0, min(width, (view_left+view_width)*width // scene_width)))
 
     def _rebuild_ruler_pixmap(self, width, height):
         max_len = self._model.cached_max_len
-        if width <= 0 or height <= 0 or max_len <= 0: self._ruler_pixmap = None; return
+        if width <= 0 or height <= 0 or max_len <= 0: return None
         layout = self._model.compute_tick_layout(width)
-        if layout is None or layout.max_len <= 0: self._ruler_pixmap = None; return
+        if layout is None or layout.max_len <= 0: return None
         max_len = layout.max_len; t = theme_manager.current
         pm = QPixmap(width, height); pm.fill(t.nav_ruler_bg)
         p = QPainter(pm); p.setRenderHint(QPainter.Antialiasing, False); p.setRenderHint(QPainter.TextAntialiasing, True)
         p.setPen(QPen(t.ruler_border)); p.drawRect(QRectF(0,0,width,height).adjusted(0,0,-1,-1))
         p.setFont(self.font); p.setPen(QPen(t.ruler_fg))
         baseline_y = height-1
-        for nt in layout.minor_ticks:
-            x = int(nt/max_len*width); p.drawLine(x, baseline_y, x, baseline_y-4)
-        for tick in layout.major_ticks:
-            x = int(tick/max_len*width); p.drawLine(x, baseline_y, x, baseline_y-8)
-            display_value = 1 if tick == 0 else tick; text = self._model.format_label(display_value)
+        # Tüm tick çizgileri aynı pen ile tek drawLines çağrısında
+        major_x = layout.major_x.tolist()
+        p.drawLines([QLine(x, baseline_y, x, baseline_y-4) for x in layout.minor_x.tolist()]
+                    + [QLine(x, baseline_y, x, baseline_y-8) for x in major_x])
+        for tick, x, text in zip(layout.major_ticks, major_x, layout.major_labels):
             lbw = 60.0
             if tick == 0: tr = QRectF(0,0,lbw,height-8); al = Qt.AlignLeft|Qt.AlignVCenter
             elif tick == max_len: tr = QRectF(width-lbw,0,lbw,height-8); al = Qt.AlignRight|Qt.AlignVCenter
             else: tr = QRectF(x-lbw/2,0,lbw,height-8); al = Qt.AlignHCenter|Qt.AlignVCenter
             p.drawText(tr, al, text)
-        p.end(); self._ruler_pixmap = pm
+        p.end(); return pm
+
+    def _ruler_pixmap_for(self, width, height, max_len, theme_name):
+        key = (width, height, max_len, theme_name); cache = self._ruler_pixmaps
+        pm = cache.get(key)
+        if pm is not None: cache.move_to_end(key); return pm
+        pm = self._rebuild_ruler_pixmap(width, height)
+        if pm is not None:
+            cache[key] = pm
+            if len(cache) > self._PIXMAP_CACHE_MAX: cache.popitem(last=False)
+        return pm
 
     def _x_to_nt(self, x):
         self._model.recompute_max_len_if_needed(
@@ -55,39 +99,34 @@ class RulerWidget(QWidget):
         )
         return self._model.x_to_nt(x, self.rect().width())
 
-    def resizeEvent(self, event): self._invalidate_ruler_pixmap(); super().resizeEvent(event)
-
     def paintEvent(self, event):
         painter = QPainter(self); rect = self.rect(); width = rect.width(); height = self.height()
         t = theme_manager.current
+        bg_brush, border_pen, viewport_brush, viewport_pen, drag_brush, drag_pen = self._tools_for(t)
         max_len = self._model.recompute_max_len_if_needed(
             getattr(self.viewer, "max_sequence_length", 0),
             getattr(self.viewer, "_total_row_count", 0),
         )
         if max_len <= 0 or width <= 0:
-            painter.fillRect(rect, QBrush(t.nav_ruler_bg)); painter.setPen(QPen(t.ruler_border))
+            self._painted_span = None
+            painter.fillRect(rect, bg_brush); painter.setPen(border_pen)
             painter.drawRect(rect.adjusted(0,0,-1,-1)); painter.end(); return
-        if (self._ruler_pixmap is None or self._ruler_pixmap.width() != width or self._ruler_pixmap.height() != height or self._pixmap_max_len != max_len or self._pixmap_theme != t.name):
-            self._rebuild_ruler_pixmap(width, height); self._pixmap_max_len = max_len; self._pixmap_theme = t.name
-        if self._ruler_pixmap: painter.drawPixmap(0,0,self._ruler_pixmap)
+        ruler_pixmap = self._ruler_pixmap_for(width, height, max_len, t.name)
+        if ruler_pixmap: painter.drawPixmap(0,0,ruler_pixmap)
         else:
-            painter.fillRect(rect, QBrush(t.nav_ruler_bg)); painter.setPen(QPen(t.ruler_border)); painter.drawRect(rect.adjusted(0,0,-1,-1))
-        scene_rect = self.viewer.scene.sceneRect(); scene_width = scene_rect.width()
-        if scene_width > 0:
-            hbar = self.viewer.horizontalScrollBar(); view_left = float(hbar.value())
-            view_width = float(self.viewer.viewport().width()); view_right = view_left + view_width
-            if scene_width <= view_width: x1, x2 = 0, width
-            else: x1 = int(max(0.0,(view_left/scene_width)*width)); x2 = int(min(width,(view_right/scene_width)*width))
+            painter.fillRect(rect, bg_brush); painter.setPen(border_pen); painter.drawRect(rect.adjusted(0,0,-1,-1))
+        span = self._painted_span = self._viewport_span(width)
+        if span is not None:
+            x1, x2 = span
             if x2 > x1:
-                painter.setBrush(QBrush(t.nav_ruler_viewport_fill)); painter.setPen(QPen(t.nav_ruler_viewport_border))
+                painter.setBrush(viewport_brush); painter.setPen(viewport_pen)
                 painter.drawRect(QRectF(x1,1,x2-x1,height-2))
-        if self._dragging_window and max_len > 0:
-            a = max(0.0, min(self._drag_start_nt, self._drag_last_nt))
-            b = min(float(max_len), max(self._drag_start_nt, self._drag_last_nt))
-            if b > a:
-                x1 = int(a/max_len*width); x2 = int(b/max_len*width)
+        if self._dragging_window:
+            drag_span = self._model.nt_range_to_px(self._drag_start_nt, self._drag_last_nt, width)
+            if drag_span is not None:
+                x1, x2 = drag_span
                 if x2 > x1+2:
-                    painter.setBrush(QBrush(t.nav_ruler_drag_fill)); painter.setPen(QPen(t.nav_ruler_drag_border))
+                    painter.setBrush(drag_brush); painter.setPen(drag_pen)
                     painter.drawRect(QRectF(x1,1,x2-x1,height-2))
         painter.end()
 
@@ -116,8 +155,8 @@ class RulerWidget(QWidget):
                 self._drag_last_nt = self._x_to_nt(x)
                 self.viewer.zoom_to_nt_range(self._drag_start_nt, self._drag_last_nt)
             elif mouse_binding_manager.is_navigation_scroll_to_event(event.modifiers(), event.button()):
-                target_nt = self._x_to_nt(x); hbar = self.viewer.horizontalScrollBar()
-                vp_width = float(self.viewer.viewport().width())
+                target_nt = self._x_to_nt(x); hbar = self._hbar
+                vp_width = float(self._viewport.width())
                 center_x = target_nt * self.viewer.char_width
                 new_left = max(float(hbar.minimum()), min(center_x - vp_width/2.0, float(hbar.maximum())))
                 hbar.setValue(int(new_left))
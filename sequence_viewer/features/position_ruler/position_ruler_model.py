@@ -2,8 +2,32 @@
 # features/position_ruler/position_ruler_model.py
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
+from bisect import bisect_left
 import math
 
+# visible_span -> tick step LUT. The mapping is monotonic: a span rounds to the
+# 1-2-5 step whose limit (largest span still using it) is the first >= span.
+# Limits are x15, x30, x70 per decade; (70p, 150p] rounds up to 10p. All-integer,
+# so the lookup is one bisect with no float division.
+_NICE_STEPS = tuple(n * 10**p for p in range(0, 10) for n in (1, 2, 5))
+_SPAN_LIMITS = tuple(lim * 10**p for p in range(0, 10) for lim in (15, 30, 70))
+_LAST_STEP = len(_NICE_STEPS) - 1
+
+def compute_layout_core(max_len, view_left, view_width, char_width):
+    """Numeric core of the ruler layout: (first_pos, last_pos, step) or None.
+
+    Scalar int/float only, so it stays cheap per zoom frame and needs no JIT.
+    """
+    if max_len<=0 or view_width<=0 or char_width<=0: return None
+    first_col,last_col=_visible_cols(max_len,view_left,view_width,char_width)
+    if last_col<=first_col: return None
+    visible_span=last_col-first_col
+    return first_col+1, last_col, _NICE_STEPS[min(bisect_left(_SPAN_LIMITS,visible_span),_LAST_STEP)]
+
+def _visible_cols(max_len, view_left, view_width, char_width):
+    """[first_col, last_col): görünür sütunlar (0 tabanlı, yarı açık)."""
+    return max(0,math.floor(view_left/char_width)), min(max_len,math.ceil((view_left+view_width)/char_width))
+
 @dataclass
 class PositionRulerLayout:
     max_len:int; first_pos:int; last_pos:int; visible_span:int; step:int
@@ -13,21 +37,33 @@ class PositionRulerModel:
     def __init__(self):
         self.max_sequence_length=0; self.view_left=0.0; self.view_width=0.0
         self.char_width=1.0; self.selection_cols=None
+        # One-slot memo: repaints with unchanged inputs (expose, focus) reuse the layout.
+        self._cache_key=None; self._cache_val=None
 
     def set_state(self, *, max_len, view_left, view_width, char_width, selection_cols):
         self.max_sequence_length=max_len; self.view_left=max(view_left,0.0)
         self.view_width=max(view_width,0.0); self.char_width=max(char_width,0.0)
-        self.selection_cols=selection_cols
+        self.selection_cols=tuple(selection_cols) if selection_cols else None
+
+    def visible_pos_range(self):
+        """Mevcut durumun tam (bucket'lanmamış) (first_pos, last_pos) aralığı; 1 tabanlı, kapalı."""
+        if self.max_sequence_length<=0 or self.view_width<=0 or self.char_width<=0: return 1, 0
+        first_col,last_col=_visible_cols(self.max_sequence_length,self.view_left,self.view_width,self.char_width)
+        return first_col+1, last_col
 
     def compute_layout(self):
-        max_len=self.max_sequence_length
-        if max_len<=0 or self.view_width<=0 or self.char_width<=0: return None
-        first_col=max(0,int(math.floor(self.view_left/self.char_width)))
-        last_col=min(max_len,int(math.ceil((self.view_left+self.view_width)/self.char_width)))
-        if last_col<=first_col: return None
-        first_pos=first_col+1; last_pos=last_col; visible_span=last_pos-first_pos+1
-        if visible_span<=0: return None
-        step=self._choose_step(self.char_width,visible_span)
+        """Returned layout is shared with the memo slot; callers must not mutate it."""
+        key=(self.max_sequence_length,self.view_left,self.view_width,self.char_width,self.selection_cols)
+        if key==self._cache_key: return self._cache_val
+        result=self._compute_layout()
+        self._cache_key=key; self._cache_val=result
+        return result
+
+    def _compute_layout(self):
+        core=compute_layout_core(self.max_sequence_length,self.view_left,self.view_width,self.char_width)
+        if core is None: return None
+        first_pos,last_pos,step=core; max_len=self.max_sequence_length
+        visible_span=last_pos-first_pos+1
         sel_start=sel_end=None
         if self.selection_cols:
             s,e=self.selection_cols
@@ -41,12 +77,6 @@ class PositionRulerModel:
 
     def _choose_step(self,char_width,visible_span):
         if visible_span<=0: return 1
-        raw=visible_span/10.0
-        if raw<=1: return 1
-        power=10**int(math.floor(math.log10(raw))); base=raw/power
-        nice=1 if base<=1.5 else 2 if base<=3 else 5 if base<=7 else 10
-        cand=int(nice*power)
-        if visible_span<=100: cand=min(cand,10)
-        return max(cand,1)
+        return _NICE_STEPS[min(bisect_left(_SPAN_LIMITS,visible_span),_LAST_STEP)]
 
 
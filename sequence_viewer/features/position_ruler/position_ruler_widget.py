@@ -1,33 +1,128 @@
 # sequence_viewer/features/position_ruler/position_ruler_widget.py
 # features/position_ruler/position_ruler_widget.py
 import math
+from bisect import bisect_left, bisect_right
+from dataclasses import replace
 from typing import Optional, List
-from PyQt5.QtCore import Qt, QRectF, QVariantAnimation
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics
+import numpy as np
+from PyQt5.QtCore import Qt, QRectF, QPointF, QLine, QVariantAnimation
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics, QStaticText, QTransform
 from PyQt5.QtWidgets import QWidget, QScrollBar
 from sequence_viewer.features.sequence_viewer.sequence_viewer_widget import SequenceViewerWidget
 from sequence_viewer.features.position_ruler.position_ruler_model import PositionRulerModel, PositionRulerLayout
 from settings.sequence_viewer.theme import theme_manager
 
+# bisect_right(_DIGIT_THRESHOLDS, pos) + 1 == len(str(pos)) (pos ≥ 0); str() tahsisi olmadan basamak sayısı
+_DIGIT_THRESHOLDS = tuple(10**k for k in range(1, 19))
+
+def _visible_positions(lo, hi, step, char_width, view_left, width):
+    """[lo, hi] içindeki step katlarından 0 <= (pos-0.5)*char_width - view_left <= width olanlar.
+
+    Sınırlar kapalı formdan bulunur, float yuvarlamasına karşı en fazla birkaç adım
+    tam ifadeyle düzeltilir; döngü gövdesi sınır testi yapmaz.
+    """
+    def x(p): return (p-0.5)*char_width - view_left
+    first = max(lo, math.ceil(view_left/char_width + 0.5)); first = -(-first//step)*step
+    last = min(hi, math.floor((view_left+width)/char_width + 0.5)); last = last//step*step
+    while first <= last and x(first) < 0: first += step
+    while first-step >= lo and 0 <= x(first-step) <= width: first -= step
+    while last >= first and x(last) > width: last -= step
+    while last+step <= hi and 0 <= x(last+step) <= width: last += step
+    return range(first, last+1, step)
+
+def _compute_ticks(first_pos, last_pos, step, char_width, view_left, width):
+    """Görünür step katı tick'ler: (positions int64, xs float64) — xs widget pikseli.
+
+    Tek vektörel ifade; float64, paint'teki skaler (pos-0.5)*char_width - view_left ile bit-bit aynı.
+    """
+    start_pos = ((max(step, first_pos)+step-1)//step)*step
+    ticks = _visible_positions(start_pos, last_pos, step, char_width, view_left, width)
+    positions = np.arange(ticks.start, ticks.stop, step, dtype=np.int64)
+    return positions, (positions - 0.5)*char_width - view_left
+
+class _LabelSpans:
+    """Aynı dikey bantta çizilen etiketlerin kapalı [left, right] x aralıkları.
+
+    lefts sıralı, reach[i] = max(rights[:i+1]); çakışma testi tek bisect + komşu
+    karşılaştırması, kesişen aralıklar eklense bile (seçim etiketleri) doğru kalır.
+    """
+    __slots__ = ("lefts", "reach")
+    def __init__(self): self.lefts = []; self.reach = []
+
+    def overlaps(self, left, right):
+        i = bisect_right(self.lefts, right)
+        return i > 0 and self.reach[i-1] >= left
+
+    def add(self, left, right):
+        lefts = self.lefts; reach = self.reach
+        i = bisect_right(lefts, left)
+        lefts.insert(i, left); reach.insert(i, max(right, reach[i-1]) if i else right)
+        for j in range(i+1, len(reach)):
+            if reach[j] >= right: break
+            reach[j] = right
+
 class SequencePositionRulerWidget(QWidget):
+    _SPECIAL_LABEL_CACHE_MAX = 1024
+    _STATIC_LABEL_CACHE_MAX = 4096
+
     def __init__(self, viewer, parent=None):
         super().__init__(parent); self.viewer = viewer
         self.setMinimumHeight(24); self.setMaximumHeight(24)
         self.font = QFont("Arial", 8); self._model = PositionRulerModel()
+        self._bold_font = QFont(self.font); self._bold_font.setBold(True)
+        # Etiketler yalnızca rakam; tabular rakamlı fontta genişlik basamak sayısına bağlı → paint'te shaping yok
+        self._metrics = QFontMetrics(self.font); self._bold_metrics = QFontMetrics(self._bold_font)
+        self._label_w = self._digit_widths(self._metrics); self._bold_label_w = self._digit_widths(self._bold_metrics)
         # Ham guide sütunları — _on_guides_changed'da cache'lenir, paint sırasında
         # current_selection_cols ile birlikte değerlendirilir (stale state yok).
-        self._guide_cols_cache: List[int] = []
-        hbar = self.viewer.horizontalScrollBar()
+        self._guide_cols_cache: List[int] = []; self._guide_revision = 0
+        # Piksel bucket'lı layout memo'su: alt-piksel scroll adımları (zoom animasyonu) aynı layout'u paylaşır.
+        # Paint tick/etiket konumlarını yine tam view_left ile hesaplar; memo yalnızca step ve özel pozisyonları taşır.
+        self._layout_key = None; self._layout = None
+        # Seçim/guide etiketleri sürüklemede aynı pozisyonlarda tekrar eder; FIFO (dict ekleme sırası)
+        self._special_labels: dict = {}
+        # label → (QStaticText, genişlik); glyph yerleşimi bir kez hazırlanır, scroll'da yeniden şekillendirilmez
+        self._static_labels: dict = {}; self._bold_static_labels: dict = {}
+        hbar = self._hbar = self.viewer.horizontalScrollBar(); self._viewport = self.viewer.viewport()
         hbar.valueChanged.connect(self._on_view_changed)
         hbar.rangeChanged.connect(self._on_hbar_range_changed)
         self.viewer.selectionChanged.connect(self._on_view_changed)
         self.viewer.add_v_guide_observer(self._on_guides_changed)
-        theme_manager.themeChanged.connect(lambda _: self.update())
+        # Tema başına bir kez kurulan pen/brush'lar (nav ruler ile aynı desen)
+        self._paint_tools = None
+        theme_manager.themeChanged.connect(self._on_theme_changed)
         # Zoom animasyonu sırasında hbar.value sabit kalsa bile ruler'ı güncelle.
         anim = getattr(self.viewer, '_zoom_animation', None)
         if anim is not None:
             anim.valueChanged.connect(self._on_view_changed)
 
+    @staticmethod
+    def _digit_widths(metrics):
+        """n → "0"*(n+1) genişliği; _label_width basamak sayısıyla indeksler."""
+        return [metrics.horizontalAdvance("0"*n) for n in range(1, len(_DIGIT_THRESHOLDS)+2)]
+
+    @staticmethod
+    def _label_width(pos, widths): return widths[bisect_right(_DIGIT_THRESHOLDS, pos)]
+
+    def _static_label(self, cache, label, font):
+        entry = cache.get(label)
+        if entry is None:
+            if len(cache) >= self._STATIC_LABEL_CACHE_MAX: del cache[next(iter(cache))]
+            st = QStaticText(label); st.setTextFormat(Qt.PlainText)
+            st.setPerformanceHint(QStaticText.AggressiveCaching); st.prepare(QTransform(), font)
+            entry = cache[label] = (st, st.size().width())
+        return entry
+
+    def _on_theme_changed(self, _): self._paint_tools = None; self.update()
+
+    def _tools_for(self, t):
+        """(bg_brush, border_pen, fg_pen, selection_pen)"""
+        tools = self._paint_tools
+        if tools is None or tools[0] is not t:
+            tools = self._paint_tools = (t, (
+                QBrush(t.ruler_bg), QPen(t.ruler_border), QPen(t.ruler_fg), QPen(t.ruler_selection_fg)))
+        return tools[1]
+
     def _on_view_changed(self, *_): self.update()
 
     def _on_hbar_range_changed(self, *_):
@@ -43,7 +138,7 @@ class SequencePositionRulerWidget(QWidget):
         set_v_guides çağrısından önce selection güncellenmemiş olsa bile
         doğru sonuç üretilir.
         """
-        self._guide_cols_cache = list(getattr(self.viewer, '_v_guide_cols', []))
+        self._guide_cols_cache = list(getattr(self.viewer, '_v_guide_cols', [])); self._guide_revision += 1
         self.update()
 
     def _update_model_from_viewer(self):
@@ -51,85 +146,112 @@ class SequencePositionRulerWidget(QWidget):
         if max_len <= 0 and getattr(self.viewer, "sequence_items", None):
             try: max_len = max(len(item.sequence) for item in self.viewer.sequence_items)
             except: max_len = 0
-        view_scene_rect = self.viewer.mapToScene(self.viewer.viewport().rect()).boundingRect()
-        view_left = float(view_scene_rect.left()); view_width = float(view_scene_rect.width())
+        # Ölçek/özdeşlik transform'unda görünür aralık skaler durumdan: QPolygonF + boundingRect yok
+        transform = self.viewer.transform()
+        if transform.type() <= QTransform.TxScale:
+            sx = transform.m11()
+            view_left = self._hbar.value()/sx; view_width = self._viewport.width()/sx
+        else:
+            view_scene_rect = self.viewer.mapToScene(self._viewport.rect()).boundingRect()
+            view_left = float(view_scene_rect.left()); view_width = float(view_scene_rect.width())
         if hasattr(self.viewer, "_get_current_char_width"): char_width = float(self.viewer._get_current_char_width())
         else: char_width = float(self.viewer.char_width)
         selection_cols = getattr(self.viewer, "current_selection_cols", None)
-        self._model.set_state(max_len=max_len, view_left=view_left, view_width=view_width, char_width=char_width, selection_cols=selection_cols)
-        layout = self._model.compute_layout()
+        model = self._model
+        model.set_state(max_len=max_len, view_left=view_left, view_width=view_width, char_width=char_width, selection_cols=selection_cols)
+        key = (int(model.view_left), round(model.char_width*1024), int(model.view_width), max_len,
+               model.selection_cols, self._guide_revision)
+        if key == self._layout_key: return self._layout
+        layout = model.compute_layout()
         # Guide sütunlarını özel pozisyonlara ekle — seçim sınırlarıyla çakışanlar atlanır.
+        # Model layout'u memo'da tutar; mutasyon yerine kopya üzerinde çalışılır.
         if layout is not None and self._guide_cols_cache:
             sel_boundaries: set = set()
             if selection_cols:
                 s, e = selection_cols
                 if s > e: s, e = e, s
                 sel_boundaries = {s, e + 1}
+            specials = list(layout.special_positions)
             for col in self._guide_cols_cache:
                 if col in sel_boundaries:
                     continue
                 pos = col + 1
-                if pos not in layout.special_positions:
-                    layout.special_positions.append(pos)
+                if pos not in specials:
+                    specials.append(pos)
+            layout = replace(layout, special_positions=specials)
+        self._layout_key = key; self._layout = layout
         return layout
 
     def paintEvent(self, event):
         painter = QPainter(self); rect = self.rect(); width = rect.width(); height = rect.height()
-        t = theme_manager.current; painter.fillRect(rect, QBrush(t.ruler_bg))
+        bg_brush, border_pen, normal_pen, selection_pen = self._tools_for(theme_manager.current)
+        painter.fillRect(rect, bg_brush)
         if width <= 0: painter.end(); return
         layout = self._update_model_from_viewer()
         if layout is None or layout.max_len <= 0:
-            painter.setPen(QPen(t.ruler_border)); painter.drawRect(rect.adjusted(0,0,-1,-1)); painter.end(); return
-        painter.setPen(QPen(t.ruler_border)); painter.drawLine(rect.left(), rect.bottom()-1, rect.right(), rect.bottom()-1)
+            painter.setPen(border_pen); painter.drawRect(rect.adjusted(0,0,-1,-1)); painter.end(); return
+        painter.setPen(border_pen); painter.drawLine(rect.left(), rect.bottom()-1, rect.right(), rect.bottom()-1)
         char_width = self._model.char_width; view_left = self._model.view_left
         if char_width <= 0 or self._model.view_width <= 0: painter.end(); return
-        painter.setFont(self.font); metrics = QFontMetrics(self.font)
-        first_pos, last_pos, step = layout.first_pos, layout.last_pos, layout.step
-        special_positions = list(layout.special_positions)
-        baseline_y = height-2; tick_h = 6; normal_pen = QPen(t.ruler_fg)
-        selection_label_rects = []
-        for pos in special_positions:
-            if pos < first_pos or pos > last_pos: continue
-            x = (pos-0.5)*char_width - view_left
-            if 0 <= x <= width:
-                lw = metrics.horizontalAdvance(str(pos)); r = rect.adjusted(0,0,0,-4)
-                r.setLeft(int(x-lw/2)); r.setRight(int(x+lw/2)); selection_label_rects.append(r)
-        drawn_tick_rects = []
-        def intersects_any(lst, cand): return any(r.intersects(cand) for r in lst)
+        painter.setFont(self.font); label_w = self._label_w; label_width = self._label_width
+        bold_label_w = self._bold_label_w  # özel pozisyonlar kalın çizilir; çakışma kalın genişlikle ölçülür
+        # Layout piksel bucket'ından gelebilir; görünür aralık tam durumdan
+        first_pos, last_pos = self._model.visible_pos_range(); step = layout.step
+        special_positions = layout.special_positions  # memo'daki layout; yalnızca okunur
+        baseline_y = height-2; tick_h = 6
+        label_top = rect.top()
+        selection_spans = _LabelSpans()
+        if special_positions:
+            # Özel pozisyonların görünür aralığı bir kez; sıralı kopya bisect ile pencereye kesilir
+            special_vis = _visible_positions(first_pos, last_pos, 1, char_width, view_left, width)
+            sp_lo = special_vis.start; sp_hi = special_vis.stop-1
+            sorted_specials = sorted(special_positions)
+            for pos in sorted_specials[bisect_left(sorted_specials, sp_lo):bisect_right(sorted_specials, sp_hi)]:
+                x = (pos-0.5)*char_width - view_left
+                lw = label_width(pos, bold_label_w); selection_spans.add(int(x-lw/2), int(x+lw/2))
+        # Tick etiketleri artan x'te ve sabit 40px kutuda: tick-tick çakışması yalnızca son çizilen
+        # etiketin sağ kenarıyla karşılaştırılır (O(1)); seçim etiketi yoksa o test de atlanır
+        tick_reach = [None]; check_selection = bool(selection_spans.lefts)
         def can_draw_tick(cx):
-            cand = rect.adjusted(0,0,0,-4); cand.setLeft(int(cx-20)); cand.setRight(int(cx+20))
-            if intersects_any(selection_label_rects, cand): return False
-            if intersects_any(drawn_tick_rects, cand): return False
-            drawn_tick_rects.append(cand); return True
+            left = int(cx-20); right = int(cx+20)
+            last_right = tick_reach[0]
+            if last_right is not None and left <= last_right: return False
+            if check_selection and selection_spans.overlaps(left, right): return False
+            tick_reach[0] = right; return True
+        static_label = self._static_label; static_labels = self._static_labels
+        def draw_label(x, lw, label):
+            # drawText(rect, AlignHCenter|AlignTop) ile aynı yerleşim: kutu içinde yatay ortala
+            left = int(x-lw/2); st, st_w = static_label(static_labels, label, self.font)
+            painter.drawStaticText(QPointF(left + (int(x+lw/2)-left+1-st_w)/2.0, label_top), st)
+        # Tick çizgileri toplanıp tek drawLines ile; etiketler ikinci geçişte (aynı pen)
+        painter.setPen(normal_pen); tick_lines = []
         if 1 >= first_pos and 1 <= last_pos:
             x = (1-0.5)*char_width - view_left
             if 0 <= x <= width:
-                painter.setPen(normal_pen); painter.drawLine(int(x), baseline_y, int(x), baseline_y-tick_h)
-                if can_draw_tick(x):
-                    lw = metrics.horizontalAdvance("1"); r = rect.adjusted(0,0,0,-4)
-                    r.setLeft(int(x-lw/2)); r.setRight(int(x+lw/2))
-                    painter.drawText(r, Qt.AlignHCenter|Qt.AlignTop, "1")
-        start_pos = (((max(step, first_pos)+step-1)//step)*step); pos = start_pos
-        while pos <= last_pos:
-            x = (pos-0.5)*char_width - view_left
-            if 0 <= x <= width:
-                painter.setPen(normal_pen); painter.drawLine(int(x), baseline_y, int(x), baseline_y-tick_h)
-                if can_draw_tick(x):
-                    label = str(pos); lw = metrics.horizontalAdvance(label)
-                    r = rect.adjusted(0,0,0,-4); r.setLeft(int(x-lw/2)); r.setRight(int(x+lw/2))
-                    painter.drawText(r, Qt.AlignHCenter|Qt.AlignTop, label)
-            pos += step
+                tick_lines.append(QLine(int(x), baseline_y, int(x), baseline_y-tick_h))
+                if can_draw_tick(x): draw_label(x, label_w[0], "1")
+        positions, xs = _compute_ticks(first_pos, last_pos, step, char_width, view_left, width)
+        if len(positions):
+            tick_top = baseline_y-tick_h
+            tick_lines += [QLine(xi, baseline_y, xi, tick_top) for xi in xs.astype(np.int32).tolist()]
+            pos_list = positions.tolist()
+            for pos, x, label in zip(pos_list, xs.tolist(), map(str, pos_list)):
+                if can_draw_tick(x): draw_label(x, label_width(pos, label_w), label)
+        if tick_lines: painter.drawLines(tick_lines)
         if special_positions:
-            bold_font = QFont(self.font); bold_font.setBold(True)
-            painter.setFont(bold_font); painter.setPen(QPen(t.ruler_selection_fg))
-            drawn_special = set(); drawn_special_rects = []
+            painter.setFont(self._bold_font); painter.setPen(selection_pen)
+            drawn_special = set(); special_spans = _LabelSpans(); special_labels = self._special_labels
             for pos in special_positions:
-                if pos in drawn_special or pos < first_pos or pos > last_pos: continue
+                # Çizim sırası (seçim → guide) çakışmada önceliği belirler; sıralı kopya kullanılmaz
+                if not sp_lo <= pos <= sp_hi or pos in drawn_special: continue
                 drawn_special.add(pos); x = (pos-0.5)*char_width - view_left
-                if x < 0 or x > width: continue
-                label = str(pos); lw = metrics.horizontalAdvance(label)
-                cand = rect.adjusted(0,0,0,-4); cand.setLeft(int(x-lw/2)); cand.setRight(int(x+lw/2))
-                if intersects_any(drawn_special_rects, cand): continue
-                drawn_special_rects.append(cand)
-                painter.drawText(cand, Qt.AlignHCenter|Qt.AlignTop, label)
+                lw = label_width(pos, bold_label_w); left = int(x-lw/2); right = int(x+lw/2)
+                if special_spans.overlaps(left, right): continue
+                special_spans.add(left, right)
+                label = special_labels.get(pos)
+                if label is None:
+                    if len(special_labels) >= self._SPECIAL_LABEL_CACHE_MAX: del special_labels[next(iter(special_labels))]
+                    label = special_labels[pos] = str(pos)
+                st, st_w = static_label(self._bold_static_labels, label, self._bold_font)
+                painter.drawStaticText(QPointF(left + (right-left+1-st_w)/2.0, label_top), st)
         painter.end()
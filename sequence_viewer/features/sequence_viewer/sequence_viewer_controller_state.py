@@ -16,6 +16,8 @@ class MouseSelectionState:
     drag_end_row: Optional[int] = None
     last_notified_row_range: Optional[tuple[int, int]] = None
     last_drag_sel_range: Optional[tuple[int, int, int, int]] = None
+    last_drag_cell: Optional[tuple[int, int]] = None
+    pending_drag_cell: Optional[tuple[int, int]] = None
 
 
 @dataclass
@@ -1,5 +1,6 @@
 # sequence_viewer/features/sequence_viewer/sequence_viewer_model.py
 # features/sequence_viewer/sequence_viewer_model.py
+from collections import Counter
 from typing import List, Optional, Tuple
 
 class SequenceViewerModel:
@@ -8,9 +9,20 @@ class SequenceViewerModel:
         self._sequence_provider = None
         self._provider_row_count = 0
         self.max_sequence_length = 0
+        # Liste modunda uzunluk → satır sayısı; silmede max tüm dizileri taramadan güncellenir
+        self._len_counts: Counter = Counter()
         self.selection_start_row = None
         self.selection_start_col = None
-        self.current_selection_cols = None
+        self._current_selection_cols = None
+        # Seçim sütunları her değiştiğinde artar; tüketiciler türetilmiş değerleri cache'ler.
+        self.selection_revision = 0
+
+    @property
+    def current_selection_cols(self): return self._current_selection_cols
+    @current_selection_cols.setter
+    def current_selection_cols(self, cols):
+        if cols != self._current_selection_cols:
+            self._current_selection_cols = cols; self.selection_revision += 1
 
     def _using_provider(self):
         return self._sequence_provider is not None
@@ -22,8 +34,9 @@ class SequenceViewerModel:
                 self.max_sequence_length = len(sequence)
             return self._provider_row_count - 1
         self._sequences.append(sequence)
-        if len(sequence) > self.max_sequence_length:
-            self.max_sequence_length = len(sequence)
+        length = len(sequence); self._len_counts[length] += 1
+        if length > self.max_sequence_length:
+            self.max_sequence_length = length
         return len(self._sequences) - 1
 
     def set_sequences(self, sequences):
@@ -34,7 +47,7 @@ class SequenceViewerModel:
         self.clear_selection()
 
     def set_sequence_source(self, row_count, max_sequence_length, sequence_provider):
-        self._sequences.clear()
+        self._sequences.clear(); self._len_counts.clear()
         self._sequence_provider = sequence_provider
         self._provider_row_count = int(row_count)
         self.max_sequence_length = int(max_sequence_length)
@@ -49,8 +62,11 @@ class SequenceViewerModel:
             return
         if index < 0 or index >= len(self._sequences):
             raise IndexError(f"Sequence index {index} out of range")
-        del self._sequences[index]
-        self.recalc_max_sequence_length()
+        length = len(self._sequences.pop(index))
+        counts = self._len_counts; counts[length] -= 1
+        if counts[length] <= 0:
+            del counts[length]
+            if length >= self.max_sequence_length: self.max_sequence_length = max(counts, default=0)
         self.clear_selection()
 
     def move_sequence(self, from_index, to_index):
@@ -67,12 +83,13 @@ class SequenceViewerModel:
         self.clear_selection()
 
     def clear_sequences(self):
-        self._sequences.clear(); self._sequence_provider = None; self._provider_row_count = 0; self.max_sequence_length = 0; self.clear_selection()
+        self._sequences.clear(); self._len_counts.clear(); self._sequence_provider = None; self._provider_row_count = 0; self.max_sequence_length = 0; self.clear_selection()
 
     def recalc_max_sequence_length(self):
         if self._using_provider():
             return self.max_sequence_length
-        self.max_sequence_length = max((len(s) for s in self._sequences), default=0)
+        self._len_counts = Counter(map(len, self._sequences))
+        self.max_sequence_length = max(self._len_counts, default=0)
         return self.max_sequence_length
 
     def get_sequences(self):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import QPoint, Qt
+from PyQt5.QtCore import QPoint, Qt, QTimer
 
 from settings.bindings.mouse import MouseAction, mouse_binding_manager
 
@@ -8,6 +8,9 @@ from .sequence_viewer_controller_state import MouseSelectionState
 
 
 class SequenceViewerMouseController:
+    # Drag-selection updates are throttled to roughly one per frame.
+    _DRAG_UPDATE_INTERVAL_MS = 16
+
     def __init__(
         self,
         model,
@@ -26,6 +29,15 @@ class SequenceViewerMouseController:
         self._on_row_clicked = on_row_clicked
         self._state = MouseSelectionState()
         self._v_guide_cols: list[int] = []
+        self._drag_timer = QTimer()
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(self._DRAG_UPDATE_INTERVAL_MS)
+        self._drag_timer.timeout.connect(self._apply_pending_drag_selection)
+        # (scroll_x, scroll_y) snapshot; with an identity view transform
+        # scene = viewport + scroll, so drag moves skip mapToScene. None = use mapToScene.
+        self._scroll_origin: tuple[int, int] | None = None
+        view.horizontalScrollBar().valueChanged.connect(self._refresh_scroll_origin)
+        view.verticalScrollBar().valueChanged.connect(self._refresh_scroll_origin)
 
     @property
     def is_selecting(self) -> bool:
@@ -44,6 +56,8 @@ class SequenceViewerMouseController:
         self._view.set_v_guides(self._v_guide_cols)
 
     def clear(self) -> None:
+        self._drag_timer.stop()
+        self._scroll_origin = None
         self._state = MouseSelectionState()
         self.clear_v_guides()
 
@@ -71,6 +85,14 @@ class SequenceViewerMouseController:
         self._state.press_scene_col = col
         self._state.drag_started = False
         self._state.last_drag_sel_range = None
+        self._state.last_drag_cell = None
+        self._state.pending_drag_cell = None
+        self._scroll_origin = None
+        if self._view.transform().isIdentity():
+            self._scroll_origin = (
+                self._view.horizontalScrollBar().value(),
+                self._view.verticalScrollBar().value(),
+            )
         return True
 
     def handle_mouse_move(self, event) -> bool:
@@ -93,6 +115,7 @@ class SequenceViewerMouseController:
 
         self._view.viewport().unsetCursor()
         self._view.viewport().setCursor(Qt.IBeamCursor)
+        self._scroll_origin = None
 
         if self._state.drag_started:
             return self._finish_drag_selection(event)
@@ -124,13 +147,45 @@ class SequenceViewerMouseController:
         self._view.viewport().setCursor(Qt.SizeHorCursor)
         return True
 
+    def _refresh_scroll_origin(self, *_args) -> None:
+        if self._scroll_origin is not None:
+            self._scroll_origin = (
+                self._view.horizontalScrollBar().value(),
+                self._view.verticalScrollBar().value(),
+            )
+
+    def _drag_cell(self, event) -> tuple[int, int]:
+        origin = self._scroll_origin
+        if origin is None:
+            return self._view.scene_pos_to_row_col(self._view.mapToScene(event.pos()))
+        pos = event.pos()
+        return self._view.scene_xy_to_row_col(origin[0] + pos.x(), origin[1] + pos.y())
+
     def _update_drag_selection(self, event) -> bool:
-        scene_pos = self._view.mapToScene(event.pos())
-        row, col = self._view.scene_pos_to_row_col(scene_pos)
+        cell = self._drag_cell(event)
+        if cell == self._state.last_drag_cell:
+            return True
+        self._state.last_drag_cell = cell
+        self._state.pending_drag_cell = cell
+        if not self._drag_timer.isActive():
+            self._drag_timer.start()
+        return True
+
+    def _flush_pending_drag_selection(self) -> None:
+        if self._drag_timer.isActive():
+            self._drag_timer.stop()
+            self._apply_pending_drag_selection()
+
+    def _apply_pending_drag_selection(self) -> None:
+        cell = self._state.pending_drag_cell
+        if cell is None or not self._state.is_selecting:
+            return
+        self._state.pending_drag_cell = None
+        row, col = cell
         self._state.drag_end_row = row
         sel_range = self._model.update_selection(row, col)
         if sel_range == self._state.last_drag_sel_range:
-            return True
+            return
         self._state.last_drag_sel_range = sel_range
         if sel_range:
             self._view.set_visual_selection(*sel_range)
@@ -148,9 +203,9 @@ class SequenceViewerMouseController:
         self._notify_selection_changed()
         self._tooltip_controller.update_drag_tooltip(sel_range)
         self._notify_row_range(row)
-        return True
 
     def _finish_drag_selection(self, event) -> bool:
+        self._flush_pending_drag_selection()
         self._state.is_selecting = False
         self._state.drag_started = False
         row_start = self._state.press_scene_row
@@ -158,6 +213,7 @@ class SequenceViewerMouseController:
         self._state.drag_end_row = None
         self._state.last_notified_row_range = None
         self._state.last_drag_sel_range = None
+        self._state.last_drag_cell = None
         self._state.press_pos = None
 
         self._tooltip_controller.restore_last_panel_or_clear()
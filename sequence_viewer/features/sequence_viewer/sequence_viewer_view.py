@@ -29,6 +29,7 @@ def _remap_row(row: int, from_idx: int, to_idx: int) -> int:
 
 class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInertiaMixin, QGraphicsView):
     _POOL_BUFFER: int = 8
+    _POOL_BULK_MIN: int = 32  # index askıya alma eşiği (bkz. _ensure_pool_size)
 
     def __init__(self, parent=None, *, char_width=12.0, char_height=18.0):
         super().__init__(parent)
@@ -57,6 +58,12 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setDragMode(QGraphicsView.NoDrag)
+        # Çok sayıda satır item'ı aynı karede güncellenir (seçim, zoom, pool kaydırma);
+        # dirty bölge birleştirmesi yerine viewport tek seferde yeniden çizilir
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Tam güncellemede antialiasing için dirty rect'leri 2px büyütmenin anlamı yok.
+        # DontSavePainterState açılmaz: AnnotationGraphicsItem antialiasing/transform'u geri almaz.
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         self.setMouseTracking(True)
         self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         from PyQt5.QtWidgets import QFrame
@@ -75,7 +82,6 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
 
     def _on_theme_changed(self, _theme):
         self._apply_scene_background()
-        self.scene.invalidate()
         self.viewport().update()
 
     def _on_display_settings_changed(self):
@@ -85,7 +91,6 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
             item.refresh_display_settings()
         self._reposition_items()
         self._update_scene_rect()
-        self.scene.invalidate()
         self.viewport().update()
 
     # ── Row layout ─────────────────────────────────────────────────────────
@@ -158,6 +163,18 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
         return ''
 
     def _ensure_pool_size(self, needed: int) -> None:
+        missing = needed - len(self.sequence_items)
+        if missing <= 0:
+            return
+        # Toplu büyütmede (ilk remount, viewport büyümesi) BSP her addItem'da tek tek güncellenmez;
+        # eski index yöntemine dönüşte ağaç tek seferde kurulur (_on_zoom_finished ile aynı desen).
+        # Geri dönüş annotation'lar dahil tüm sahneyi yeniden indeksler: yalnızca pool en az
+        # ikiye katlanıyorsa ve eklenen item sayısı eşiği aşıyorsa değer
+        index_method = self.scene.itemIndexMethod()
+        bulk = (missing >= max(self._POOL_BULK_MIN, len(self.sequence_items))
+                and index_method != QGraphicsScene.NoIndex)
+        if bulk:
+            self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         while len(self.sequence_items) < needed:
             item = SequenceGraphicsItem(
                 sequence='',
@@ -167,8 +184,11 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
                 base_char_width=self._base_char_width,
             )
             item.setVisible(False)
+            item.setCacheMode(self._item_cache_mode())
             self.scene.addItem(item)
             self.sequence_items.append(item)
+        if bulk:
+            self.scene.setItemIndexMethod(index_method)
 
     def _mount_item(self, item: SequenceGraphicsItem, row_idx: int) -> None:
         if row_idx < 0 or row_idx >= self._total_row_count:
@@ -176,9 +196,10 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
             return
         seq = self._get_sequence_for_row(row_idx)
         item.prepareGeometryChange()
-        item._model.sequence = seq
-        item._model.length = len(seq)
+        item.set_sequence(seq)
         item.row_index = row_idx
+        # Row layout varken drawBackground aynı bant rengini tüm stride boyunca boyar
+        item.draw_row_background = self._row_layout is None
         item.setPos(0, self._y_for_row(row_idx))
         item.setVisible(True)
         item.set_row_highlighted(row_idx in self._h_guide_rows)
@@ -252,14 +273,13 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
         self._row_layout = None
         self._selection_dim_ranges = []
         self.scene.setSceneRect(0, 0, 0, 0)
-        self.scene.invalidate()
+        self.viewport().update()
 
     def clear_visual_selection(self):
         self._selection_range = None
         for item in self.sequence_items:
-            item._model.clear_selection()
-            item.update()
-        self.scene.invalidate()
+            item.clear_selection()
+        # Arka plan cache'i yok: scene.invalidate() gerekmez; overlay için tek viewport update yeter
         self.viewport().update()
 
     def remap_visual_selection(self, from_index: int, to_index: int) -> None:
@@ -276,16 +296,19 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
 
     def set_visual_selection(self, row_start, row_end, col_start, col_end):
         self._selection_range = (row_start, row_end, col_start, col_end)
+        # Döngü tüm satırlar değil yalnızca pool (görünür satırlar + tampon) üzerinde.
+        # Önceki aralığa göre delta tutulmaz: koordinatörler item seçimlerini doğrudan da
+        # yazar. Geçersiz sütunda hiçbir satır seçili değil → aralık boşaltılır.
+        if col_start < 0 or col_end < 0:
+            row_start, row_end = 0, -1
         for item in self.sequence_items:
             if not item.isVisible():
                 continue
-            r = item.row_index
-            if row_start <= r <= row_end and col_start >= 0 and col_end >= 0:
+            # Yalnızca seçimi gerçekten değişen satırlar update() alır (item cache'i korunur)
+            if row_start <= item.row_index <= row_end:
                 item.set_selection(col_start, col_end)
             else:
-                item._model.clear_selection()
-                item.update()
-        self.scene.invalidate()
+                item.clear_selection()
         self.viewport().update()
 
     # ── Scene rect ─────────────────────────────────────────────────────────
@@ -295,7 +318,7 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
             self.scene.setSceneRect(0, 0, 0, 0)
             self.max_sequence_length = 0
             if invalidate:
-                self.scene.invalidate()
+                self.viewport().update()
             return
         trailing = self._current_trailing_padding()
         width = self.max_sequence_length * self.char_width + trailing
@@ -306,22 +329,27 @@ class SequenceViewerView(ZoomMixin, OverlayMixin, InteractionMixin, ScrollInerti
             stride = self._per_row_annot_h + self.char_height
             height = float(self._total_row_count * stride)
         self.scene.setSceneRect(0, 0, width, height)
+        # Arka plan cache'i yok ve FullViewportUpdate: scene.invalidate() (rect/layer ne olursa
+        # olsun) tek viewport repaint'inden fazlasını yapmaz, doğrudan o istenir
         if invalidate:
-            self.scene.invalidate()
+            self.viewport().update()
 
     # ── Coordinate conversion ──────────────────────────────────────────────
 
     def scene_pos_to_row_col(self, scene_pos):
+        return self.scene_xy_to_row_col(scene_pos.x(), scene_pos.y())
+
+    def scene_xy_to_row_col(self, scene_x: float, scene_y: float):
         layout = self._row_layout
         if layout is not None and layout.row_count > 0:
-            raw_row = layout.row_at_y(scene_pos.y())
+            raw_row = layout.row_at_y(scene_y)
         else:
             stride = self._per_row_annot_h + self.char_height
-            raw_row = int(scene_pos.y() // stride) if stride > 0 else 0
+            raw_row = int(scene_y // stride) if stride > 0 else 0
         cw = self._get_current_char_width()
         if cw <= 0:
             cw = max(self.char_width, 0.000001)
-        col = int(scene_pos.x() // cw)
+        col = int(scene_x // cw)
         return raw_row, col
 
     def selection_viewport_anchor(self, row_end: int, col_end: int):
@@ -1,8 +1,8 @@
 # sequence_viewer/features/sequence_viewer/sequence_viewer_zoom.py
 # features/sequence_viewer/sequence_viewer_zoom.py
 from __future__ import annotations
-from PyQt5.QtCore import QEasingCurve, QVariantAnimation
-from PyQt5.QtWidgets import QGraphicsScene
+from PyQt5.QtCore import QEasingCurve, QElapsedTimer, QVariantAnimation
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsScene
 from sequence_viewer.graphics.sequence_item.sequence_item import SequenceGraphicsItem
 
 
@@ -23,6 +23,9 @@ class ZoomMixin:
         SequenceGraphicsItem.LINE_MODE
     """
 
+    # Animasyon frame'leri arasında en az bu kadar ms (≤ ~90 apply/s); son değer finished'da uygulanır
+    _ZOOM_MIN_FRAME_MS = 10
+
     def _init_zoom(self):
         self._zoom_animation = QVariantAnimation(self)
         self._zoom_animation.setEasingCurve(QEasingCurve.OutExpo)
@@ -32,6 +35,9 @@ class ZoomMixin:
         self._zoom_view_width_px = None
         self._zoom_base_cw: float | None = None
         self._on_zoom_step_cb = None
+        # Son uygulanan animasyon char_width'i ve zamanı; alt-piksel / sık frame'ler birleştirilir
+        self._zoom_applied_cw: float | None = None
+        self._zoom_frame_clock = QElapsedTimer()
 
     # ── public API ────────────────────────────────────────────────────────────
 
@@ -80,13 +86,7 @@ class ZoomMixin:
         applied = float(new_char_width)
         is_animating = self._zoom_animation.state() == QVariantAnimation.Running
         if is_animating:
-            for item in self.sequence_items:
-                item._set_char_width_fast(applied)
-            self.char_width = applied
-            self._update_scene_rect(invalidate=False)
-            if center_nt is not None:
-                self._recenter_horizontally(center_nt, view_width_px)
-            self.viewport().update()
+            self._apply_char_width_fast(applied, center_nt, view_width_px)
         else:
             for item in self.sequence_items:
                 item.set_char_width(applied)
@@ -98,6 +98,21 @@ class ZoomMixin:
                 self._recenter_horizontally(center_nt, view_width_px)
             self.viewport().update()
 
+    def _apply_char_width_fast(self, new_char_width, center_nt, view_width_px):
+        """Animasyon frame'i: yalnızca genişlik skaleri değişir, geometri senkronu yok.
+
+        _on_zoom_value_changed bunu doğrudan çağırır (apply_char_width'in eşik/animasyon
+        durumu kontrolleri her frame'de tekrarlanmaz); BSP ve item cache'leri
+        _on_zoom_finished'da tek seferde güncellenir.
+        """
+        for item in self.sequence_items:
+            item._set_char_width_fast(new_char_width)
+        self.char_width = new_char_width
+        self._update_scene_rect(invalidate=False)
+        if center_nt is not None:
+            self._recenter_horizontally(center_nt, view_width_px)
+        self.viewport().update()
+
     def start_zoom_animation(self, target_char_width, center_nt, view_width_px=None):
         if view_width_px is None:
             view_width_px = float(self.viewport().width())
@@ -115,6 +130,9 @@ class ZoomMixin:
         )
         self._zoom_center_nt = center_nt
         self._zoom_view_width_px = view_width_px
+        # _set_char_width_fast update() çağırmaz; cache'li item'lar eski pixmap'i basardı
+        self._set_items_cache_mode(QGraphicsItem.NoCache)
+        self._zoom_applied_cw = None
         self._zoom_animation.setDuration(120)
         self._zoom_animation.setStartValue(current)
         self._zoom_animation.setEndValue(target_char_width)
@@ -139,11 +157,20 @@ class ZoomMixin:
                 item.set_char_width(self.char_width)
             self._update_scene_rect()
         self._recenter_horizontally(center_nt, vp_w)
-        self.scene.invalidate()
         self.viewport().update()
 
     # ── internal helpers ──────────────────────────────────────────────────────
 
+    def _set_items_cache_mode(self, mode):
+        for item in self.sequence_items:
+            item.setCacheMode(mode)
+
+    def _item_cache_mode(self):
+        """Yeni pool item'ları için geçerli cache modu (animasyon sırasında NoCache)."""
+        if self._zoom_animation.state() == QVariantAnimation.Running:
+            return QGraphicsItem.NoCache
+        return QGraphicsItem.DeviceCoordinateCache
+
     def _effective_char_width(self):
         if self._zoom_animation.state() == QVariantAnimation.Running:
             v = self._zoom_animation.currentValue()
@@ -179,10 +206,20 @@ class ZoomMixin:
     def _on_zoom_value_changed(self, value):
         if self._zoom_center_nt is None or self._zoom_view_width_px is None:
             return
+        value = float(value)
+        last = self._zoom_applied_cw
+        if last is not None:
+            # Sahne genişliği bir pikselden az değişiyorsa ya da önceki apply çok yeniyse frame atlanır
+            if abs(value - last) * max(self.max_sequence_length, 1) < 1.0:
+                return
+            if self._zoom_frame_clock.isValid() and self._zoom_frame_clock.elapsed() < self._ZOOM_MIN_FRAME_MS:
+                return
         try:
-            self.apply_char_width(float(value), self._zoom_center_nt, float(self._zoom_view_width_px))
+            self._apply_char_width_fast(value, self._zoom_center_nt, float(self._zoom_view_width_px))
         except Exception:
             pass
+        self._zoom_applied_cw = value
+        self._zoom_frame_clock.start()
         if self._on_zoom_step_cb is not None:
             self._on_zoom_step_cb()
 
@@ -190,8 +227,9 @@ class ZoomMixin:
         """Animasyon bitişinde BSP ağacını senkronize et.
 
         PERFORMANS — neden bu yapı:
-          Animasyon boyunca _set_char_width_fast ile item'lar zaten son char_width'e
-          ulaşmış olur; burada tekrar model güncellemesi gerekmez.
+          Animasyon boyunca _set_char_width_fast ile item'lar genellikle son char_width'e
+          ulaşmış olur; frame birleştirme son değeri atladıysa burada yine hızlı yolla
+          uygulanır (set_char_width değil).
 
           NoIndex → N × prepareGeometryChange → BspTreeIndex sırası kritik:
           NoIndex modunda bireysel BSP güncellemesi tetiklenmez (O(1) per call),
@@ -205,6 +243,16 @@ class ZoomMixin:
             gereksiz update() ve prepareGeometryChange tetikler.
         """
         self._zoom_base_cw = None
+        # Atlanmış son frame: bitiş değeri hızlı yolla uygulanır (geometri aşağıda tek seferde senkronlanır)
+        end_cw = self._zoom_animation.endValue()
+        late_apply = end_cw is not None and self._zoom_applied_cw != float(end_cw)
+        if late_apply:
+            end_cw = float(end_cw)
+            for item in self.sequence_items:
+                item._set_char_width_fast(end_cw)
+            self.char_width = end_cw
+        self._zoom_applied_cw = None
+        self._set_items_cache_mode(QGraphicsItem.DeviceCoordinateCache)
 
         self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         for item in self.sequence_items:
@@ -218,6 +266,8 @@ class ZoomMixin:
                 float(self._zoom_view_width_px or self.viewport().width()),
             )
         self.viewport().update()
+        if late_apply and self._on_zoom_step_cb is not None:
+            self._on_zoom_step_cb()
 
     def _visible_row_range(self) -> tuple:
         """Return (scene_top, scene_bottom) of the currently visible viewport area."""
@@ -230,7 +280,8 @@ class ZoomMixin:
     def _current_trailing_padding(self):
         if not self.sequence_items:
             return self.trailing_padding_text_px
-        for item in self.sequence_items:
-            if item.display_mode == SequenceGraphicsItem.LINE_MODE:
-                return self.trailing_padding_line_px
+        # Pool item'ları aynı char_width/char_height/base_char_width'i paylaşır → display_mode
+        # hepsinde aynı; animasyon frame'lerinde tüm pool'u taramak yerine ilk item yeterli
+        if self.sequence_items[0].display_mode == SequenceGraphicsItem.LINE_MODE:
+            return self.trailing_padding_line_px
         return self.trailing_padding_text_px
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from math import pow
+from math import exp, log
 
 from settings.bindings.mouse import mouse_binding_manager
 
@@ -13,6 +13,13 @@ class SequenceViewerZoomController:
         self._view = view
         self._tooltip_controller = tooltip_controller
         self._state = ZoomState()
+        # log(base_factor), log(accel_factor); refreshed when the bindings change.
+        self._log_factor_key: tuple[float, float] | None = None
+        self._log_base = 0.0
+        self._log_accel = 0.0
+        # Selection-derived zoom pivot, reused while (selection_revision, max_len) holds.
+        self._cached_center_key: tuple[int, int] | None = None
+        self._cached_center_nt: float | None = None
 
     @property
     def wheel_zoom_streak_dir(self):
@@ -27,9 +34,10 @@ class SequenceViewerZoomController:
         self._state.wheel_zoom_streak_len = 0
 
     def handle_wheel_event(self, event) -> bool:
-        if mouse_binding_manager.is_h_scroll_event(event.modifiers()):
+        modifiers = event.modifiers()
+        if mouse_binding_manager.is_h_scroll_event(modifiers):
             return self._handle_horizontal_scroll(event)
-        if not mouse_binding_manager.is_zoom_event(event.modifiers()):
+        if not mouse_binding_manager.is_zoom_event(modifiers):
             return False
         return self._handle_zoom(event)
 
@@ -50,33 +58,34 @@ class SequenceViewerZoomController:
         return True
 
     def _handle_zoom(self, event) -> bool:
+        view = self._view
         delta = event.angleDelta().y()
-        if delta == 0 or not self._view.sequence_items:
+        if delta == 0 or not view.sequence_items:
             return True
 
         self._tooltip_controller.clear_panel()
-        stop_fn = getattr(self._view, "stop_scroll_inertia", None)
+        stop_fn = getattr(view, "stop_scroll_inertia", None)
         if callable(stop_fn):
             stop_fn()
         steps = delta / 120.0
         direction = 1 if steps > 0 else -1
         self._update_zoom_streak(direction)
 
-        view_width_px = float(self._view.viewport().width())
+        view_width_px = float(view.viewport().width())
         if view_width_px <= 0:
             return True
 
-        current_cw = self._view.current_char_width()
+        current_cw = view.current_char_width()
         if current_cw <= 0:
-            current_cw = max(self._view.char_width, 0.001)
+            current_cw = max(view.char_width, 0.001)
 
-        center_nt = self._model.get_selection_center_nt()
+        center_nt = self._selection_center_nt()
         if center_nt is None:
-            caret = getattr(self._view, '_caret', None)
+            caret = getattr(view, '_caret', None)
             if caret is not None:
                 center_nt = float(caret[0])
             else:
-                old_left_px = float(self._view.horizontalScrollBar().value())
+                old_left_px = float(view.horizontalScrollBar().value())
                 cursor_x = float(event.pos().x())
                 center_nt = (old_left_px + cursor_x) / current_cw
 
@@ -84,13 +93,21 @@ class SequenceViewerZoomController:
         if abs(target_cw - current_cw) < 0.0001:
             return True
 
-        self._view.start_zoom_animation(
+        view.start_zoom_animation(
             target_char_width=target_cw,
             center_nt=center_nt,
             view_width_px=view_width_px,
         )
         return True
 
+    def _selection_center_nt(self) -> float | None:
+        model = self._model
+        key = (model.selection_revision, model.max_sequence_length)
+        if key != self._cached_center_key:
+            self._cached_center_key = key
+            self._cached_center_nt = model.get_selection_center_nt()
+        return self._cached_center_nt
+
     def _update_zoom_streak(self, direction: int) -> None:
         if self._state.wheel_zoom_streak_dir == direction:
             self._state.wheel_zoom_streak_len += 1
@@ -98,15 +115,22 @@ class SequenceViewerZoomController:
             self._state.wheel_zoom_streak_dir = direction
             self._state.wheel_zoom_streak_len = 1
 
+    def _log_zoom_factors(self) -> tuple[float, float]:
+        key = (mouse_binding_manager.zoom_base_factor, mouse_binding_manager.zoom_accel_factor)
+        if key != self._log_factor_key:
+            self._log_factor_key = key
+            self._log_base = log(key[0])
+            self._log_accel = log(key[1])
+        return self._log_base, self._log_accel
+
     def _compute_target_char_width(self, current_cw: float, steps: float, direction: int) -> float:
-        streak_boost = pow(
-            mouse_binding_manager.zoom_accel_factor,
-            max(0, self._state.wheel_zoom_streak_len - 1),
-        )
-        per_step_factor = mouse_binding_manager.zoom_base_factor * streak_boost
-        magnitude_factor = pow(per_step_factor, abs(steps))
-        factor = magnitude_factor if direction > 0 else 1.0 / magnitude_factor
-        return max(
-            self._view.compute_min_char_width(),
-            min(current_cw * factor, mouse_binding_manager.zoom_max_char_width),
-        )
+        # base * accel**(streak-1), raised to |steps|, evaluated in log space: one exp().
+        log_base, log_accel = self._log_zoom_factors()
+        streak = max(0, self._state.wheel_zoom_streak_len - 1)
+        log_factor = (log_base + streak * log_accel) * abs(steps)
+        target = current_cw * exp(log_factor if direction > 0 else -log_factor)
+        max_cw = mouse_binding_manager.zoom_max_char_width
+        if target > max_cw:
+            target = max_cw
+        min_cw = self._view.compute_min_char_width()
+        return min_cw if target < min_cw else target
@@ -0,0 +1,19 @@
+# sequence_viewer/graphics/font_registry.py
+# graphics/font_registry.py
+"""Satırlar arasında paylaşılan QFont örnekleri.
+
+Dönen nesneler paylaşımlıdır; çağıran taraf üzerinde setPointSizeF/setFamily
+gibi mutasyonlar yapmamalı, farklı boyut için get_font'u yeniden çağırmalıdır.
+"""
+from functools import lru_cache
+from PyQt5.QtGui import QFont
+
+
+@lru_cache(maxsize=64)
+def get_font(family: str, style_hint: int, point_size: float) -> QFont:
+    font = QFont(family)
+    font.setStyleHint(style_hint)
+    font.setFixedPitch(style_hint == QFont.Monospace)
+    font.setPointSizeF(point_size)
+    return font
+
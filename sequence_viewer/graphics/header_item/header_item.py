@@ -7,8 +7,8 @@ row_band_highlight ile boyar.
 from __future__ import annotations
 import weakref
 from typing import Optional
-from PyQt5.QtCore import Qt, QRectF
-from PyQt5.QtGui import QPainter, QFont, QPen, QBrush, QFontMetrics, QColor
+from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5.QtGui import QPainter, QFont, QPen, QBrush, QColor, QStaticText, QTransform
 from PyQt5.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
 from sequence_viewer.graphics.header_item.header_item_model import HeaderRowModel
 from settings.sequence_viewer.theme import theme_manager
@@ -21,12 +21,15 @@ class HeaderRowItem(QGraphicsItem):
         self.row_height = int(round(row_height))
         self.annot_height = int(annot_height)
         self.below_ann_height = 0
+        self._bounding_rect = QRectF(0, 0, self.width, self.total_height)
         self.row_index = row_index
         self.font = QFont("Arial")
         self.font.setPointSizeF(self._model.compute_font_point_size())
         self._hovered = False
         self._selected = False
         self._dragging = False
+        self._static_text: Optional[QStaticText] = None  # glyph yerleşimi paint'ler arası korunur
+        self._static_key = None
         self.setAcceptHoverEvents(True)
         _ref = weakref.ref(self)
         theme_manager.themeChanged.connect(lambda theme, r=_ref: (s := r()) and s._on_theme_changed(theme))
@@ -38,10 +41,10 @@ class HeaderRowItem(QGraphicsItem):
 
     def set_annot_height(self, h):
         if self.annot_height == h: return
-        self.prepareGeometryChange(); self.annot_height = h; self.update()
+        self.prepareGeometryChange(); self.annot_height = h; self._update_bounds(); self.update()
     def set_below_ann_height(self, h):
         if self.below_ann_height == h: return
-        self.prepareGeometryChange(); self.below_ann_height = h; self.update()
+        self.prepareGeometryChange(); self.below_ann_height = h; self._update_bounds(); self.update()
     def set_hovered(self, hovered):
         if self._hovered == hovered: return
         self._hovered = hovered; self.update()
@@ -59,12 +62,13 @@ class HeaderRowItem(QGraphicsItem):
         self._model.full_text = text; self.update()
     def set_width(self, width):
         if abs(width - self.width) < 0.5: return
-        self.prepareGeometryChange(); self.width = float(width); self.update()
+        self.prepareGeometryChange(); self.width = float(width); self._update_bounds(); self.update()
     def set_row_height(self, height):
         h = int(round(height))
         if self.row_height == h: return
         self.prepareGeometryChange()
         self.row_height = h
+        self._update_bounds()
         self._model.row_height = h
         self.font.setPointSizeF(self._model.compute_font_point_size())
         self.update()
@@ -81,12 +85,24 @@ class HeaderRowItem(QGraphicsItem):
         t = theme_manager.current
         return t.text_selected if self._selected else t.text_primary
 
-    def boundingRect(self): return QRectF(0, 0, self.width, self.total_height)
+    def _static_text_for(self, text):
+        key = (text, self.font.pointSizeF())
+        if key != self._static_key:
+            static = QStaticText(text)
+            static.setTextFormat(Qt.PlainText)
+            static.setPerformanceHint(QStaticText.AggressiveCaching)
+            static.prepare(QTransform(), self.font)
+            self._static_text = static; self._static_key = key
+        return self._static_text
+
+    def _update_bounds(self): self._bounding_rect = QRectF(0, 0, self.width, self.total_height)
+    def boundingRect(self): return self._bounding_rect
     def hoverEnterEvent(self, event): self.set_hovered(True); super().hoverEnterEvent(event)
     def hoverLeaveEvent(self, event): self.set_hovered(False); super().hoverLeaveEvent(event)
 
     def paint(self, painter, option, widget=None):
-        painter.save()
+        # save()/restore() yok: header view DontSavePainterState ile çalışır; pen/brush/font
+        # her çizimden önce burada ayarlanır.
         t = theme_manager.current
         total_w = self.width
         ann_h = float(self.annot_height)
@@ -123,12 +139,14 @@ class HeaderRowItem(QGraphicsItem):
 
         # Metin
         painter.setFont(self.font)
-        metrics = QFontMetrics(self.font)
         avail_width = self._model.compute_available_width(int(total_w))
-        display_txt = self._model.choose_display_text(metrics, avail_width)
+        display_txt = self._model.display_text_for(self.font, avail_width)
         painter.setPen(QPen(self._resolve_text_color()))
-        draw_rect = QRectF(self._model.left_padding + (3 if self._selected else 0), text_top, total_w - self._model.left_padding - self._model.right_padding, row_h)
-        painter.drawText(draw_rect, Qt.AlignVCenter | Qt.AlignLeft, display_txt)
+        if display_txt:
+            static = self._static_text_for(display_txt)
+            # drawText(AlignVCenter) ile aynı hiza: satır kutusu row_h içinde ortalanır
+            text_h = self._model.ensure_metrics(self.font).height()
+            painter.drawStaticText(QPointF(self._model.left_padding + (3 if self._selected else 0), text_top + (row_h - text_h) / 2.0), static)
 
         # ---- Alt annotation bölgesi ----
         below_h = float(self.below_ann_height)
@@ -144,5 +162,3 @@ class HeaderRowItem(QGraphicsItem):
             painter.setPen(QPen(t.border_normal, 0))
             painter.drawLine(int(0), int(below_top + below_h) - 1, int(total_w), int(below_top + below_h) - 1)
 
-        painter.restore()
-
@@ -1,8 +1,8 @@
 # sequence_viewer/graphics/header_item/header_item_model.py
 # graphics/header_item/header_item_model.py
-from dataclasses import dataclass
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFontMetrics
+from dataclasses import dataclass, field
+from typing import Optional
+from PyQt5.QtGui import QFontMetrics, QFontMetricsF
 
 @dataclass
 class HeaderRowModel:
@@ -10,6 +10,14 @@ class HeaderRowModel:
     row_height: int
     left_padding: int = 6
     right_padding: int = 4
+    # Paint başına QFontMetrics / genişlik / elide hesabını önleyen cache'ler
+    _metrics: Optional[QFontMetrics] = field(default=None, init=False, repr=False, compare=False)
+    _metrics_f: Optional[QFontMetricsF] = field(default=None, init=False, repr=False, compare=False)
+    _metrics_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _display_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _display_text: str = field(default="", init=False, repr=False, compare=False)
+    _full_width_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _full_width: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def compute_font_point_size(self):
         return self.row_height * 0.5
@@ -17,10 +25,48 @@ class HeaderRowModel:
     def compute_available_width(self, total_width):
         return max(0, total_width - self.left_padding - self.right_padding)
 
-    def choose_display_text(self, metrics, available_width):
-        if available_width <= 0: return ""
-        full_width = metrics.horizontalAdvance(self.full_text)
-        if full_width <= available_width: return self.full_text
-        return metrics.elidedText(self.full_text, Qt.ElideRight, available_width)
+    def ensure_metrics(self, font):
+        """Font ailesi/boyutu/bold/italic değişmedikçe aynı QFontMetrics'i döndürür."""
+        key = (font.family(), font.pointSizeF(), font.bold(), font.italic())
+        if key != self._metrics_key:
+            self._metrics = QFontMetrics(font); self._metrics_f = QFontMetricsF(font); self._metrics_key = key
+            self._display_key = None; self._full_width_key = None
+        return self._metrics
+
+    def display_text_for(self, font, available_width):
+        """choose_display_text'in (metin, genişlik, font) ile memoize edilmiş hali."""
+        self.ensure_metrics(font)
+        key = (self.full_text, available_width)
+        if key != self._display_key:
+            # Elide ölçümü kesirli genişlikle; Qt'nin elidedText'i de öyle karar verir
+            self._display_text = self.choose_display_text(self._metrics_f, available_width)
+            self._display_key = key
+        return self._display_text
 
+    def full_width(self, metrics):
+        """full_text genişliği; metin ya da ölçümü yapan metrics nesnesi değişmedikçe yeniden ölçülmez."""
+        key = self._full_width_key
+        # metrics anahtarda tutulur (canlı kalır) ve kimlikle karşılaştırılır
+        if key is None or key[1] is not metrics or key[0] != self.full_text:
+            self._full_width = metrics.horizontalAdvance(self.full_text)
+            self._full_width_key = (self.full_text, metrics)
+        return self._full_width
 
+    def choose_display_text(self, metrics, available_width):
+        if available_width <= 0: return ""
+        text = self.full_text
+        full_width = self.full_width(metrics)
+        if full_width <= available_width or len(text) <= 1: return text
+        # elidedText(ElideRight) ile aynı karar: metin içindeki (sonraki karaktere kerning dahil)
+        # genişliği (width - ellipsis)'ten kesin küçük olan en uzun önek. Ortalama karakter
+        # genişliğinden tahmin edilip ±1 adımlarla düzeltilir; yalnızca önekler ölçülür.
+        ellipsis = "\u2026"
+        budget = available_width - metrics.horizontalAdvance(ellipsis)
+        if budget < 0: return ""
+        advance = metrics.horizontalAdvance
+        def prefix_w(k):  # text[:k]'nın tam metindeki genişliği: text[k-1]→text[k] kerning'i dahil
+            return advance(text[:k + 1]) - advance(text[k])
+        n = min(len(text) - 1, max(0, int(budget / (full_width / len(text)))))
+        while n > 0 and prefix_w(n) >= budget: n -= 1
+        while n + 1 < len(text) and prefix_w(n + 1) < budget: n += 1
+        return text[:n] + ellipsis
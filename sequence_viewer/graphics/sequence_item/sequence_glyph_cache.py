@@ -8,13 +8,78 @@ def default_nucleotide_color_map():
     from settings.sequence_viewer.color_styles import color_style_manager
     return color_style_manager.nucleotide_color_map()
 
+_shared_default_color_map = None
+
+def shared_default_color_map():
+    """Tüm satırların paylaştığı varsayılan renk haritası; çağıranlar mutasyon yapmamalı
+    (gerekirse dict(...) ile kopyalamalı). Stiller değişince bir sonraki çağrıda yeniden kurulur."""
+    global _shared_default_color_map
+    if _shared_default_color_map is None: _shared_default_color_map = default_nucleotide_color_map()
+    return _shared_default_color_map
+
 class GlyphCache:
-    def __init__(self): self._cache = {}
-    def invalidate(self): self._cache.clear()
-    def get_glyph(self, ch, font, color):
-        key = (ch, font.family(), int(round(font.pointSizeF() or font.pointSize())), font.bold(), font.italic(), color.red(), color.green(), color.blue())
-        pm = self._cache.get(key)
-        if pm is not None: return pm
+    """Font durumu başına alt cache; alt cache anahtarı (ord(ch) << 24) | 0xRRGGBB paketli int'tir.
+    Sık alfabe warm() ile tek atlas pass'inde üretilir; atlas dilimlendikten sonra tutulmaz."""
+    def __init__(self):
+        self._caches: Dict[Tuple, Dict[int, QPixmap]] = {}
+    def invalidate(self): self._caches.clear()
+
+    @staticmethod
+    def font_key(font):
+        return (font.family(), int(round(font.pointSizeF() or font.pointSize())), font.bold(), font.italic())
+
+    def get_subcache(self, font_key):
+        sub = self._caches.get(font_key)
+        if sub is None: sub = self._caches[font_key] = {}
+        return sub
+
+    def get_glyph(self, ch, font, color, subcache=None):
+        if subcache is None: subcache = self.get_subcache(self.font_key(font))
+        key = (ord(ch) << 24) | (color.rgb() & 0xFFFFFF)
+        pm = subcache.get(key)
+        if pm is None: pm = subcache[key] = self._render(ch, font, color)
+        return pm
+
+    def warm(self, font, alphabet, color_map, fallback, extra_colors=()):
+        """alphabet'teki her karakteri color_map rengiyle (ve extra_colors ile) önceden üretir.
+        Eksik glyph'ler atlas'tan dilimlenir; tek tek QPainter/QFontMetrics kurulmaz."""
+        sub = self.get_subcache(self.font_key(font))
+        colors = [color_map.get(ch.upper(), fallback) for ch in alphabet]
+        rows = [tuple(c.rgb() for c in colors)] + [tuple(c.rgb() for _ in alphabet) for c in extra_colors]
+        missing = [(r, i) for r, rgbs in enumerate(rows) for i, ch in enumerate(alphabet)
+                   if ((ord(ch) << 24) | (rgbs[i] & 0xFFFFFF)) not in sub]
+        if not missing: return
+        # Atlas yalnızca dilimleme için; copy() derin kopya olduğundan glyph'ler atlas'sız yaşar
+        atlas, slots, stride, gh = self._render_atlas(font, alphabet, rows)
+        metrics = QFontMetrics(font)
+        for r, i in missing:
+            ch = alphabet[i]
+            w = max(1, metrics.horizontalAdvance(ch))
+            sub[(ord(ch) << 24) | (rows[r][i] & 0xFFFFFF)] = atlas.copy(slots[ch] * stride, r * gh, w, gh)
+
+    @staticmethod
+    def _render_atlas(font, alphabet, rows):
+        """(atlas, slots, stride, gh): alphabet glyph'leri tek pixmap'te yan yana; rows[r][i] alphabet[i]'nin
+        r. satırdaki rgb'si. slots[ch] → sütun, kaynak rect (slot * stride, r * gh, advance, gh)."""
+        metrics = QFontMetrics(font)
+        # Slot'lar arası pay: anti-alias taşması komşu glyph'in dilimine girmesin
+        stride = max(1, max(metrics.horizontalAdvance(ch) for ch in alphabet)) + 2
+        gh = max(1, metrics.height())
+        pm = QPixmap(stride * len(alphabet), gh * len(rows))
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.TextAntialiasing, True)
+        p.setFont(font)
+        slots = {}
+        for slot, ch in enumerate(alphabet):
+            slots[ch] = slot
+            for r, rgbs in enumerate(rows):
+                p.setPen(QPen(QColor(rgbs[slot]))); p.drawText(slot * stride, r * gh + metrics.ascent(), ch)
+        p.end()
+        return pm, slots, stride, gh
+
+    @staticmethod
+    def _render(ch, font, color):
         metrics = QFontMetrics(font)
         w = max(1, metrics.horizontalAdvance(ch))
         h = max(1, metrics.height())
@@ -26,12 +91,14 @@ class GlyphCache:
         p.setPen(QPen(color))
         p.drawText(0, metrics.ascent(), ch)
         p.end()
-        self._cache[key] = pm
         return pm
 
 GLYPH_CACHE = GlyphCache()
 
-def _on_styles_changed(): GLYPH_CACHE.invalidate()
+def _on_styles_changed():
+    # Item'ların stylesChanged slot'larından önce bağlanır; refresh_color_map yeni haritayı görür
+    global _shared_default_color_map
+    _shared_default_color_map = None; GLYPH_CACHE.invalidate()
 try:
     from settings.sequence_viewer.color_styles import color_style_manager
     color_style_manager.stylesChanged.connect(_on_styles_changed)
@@ -1,31 +1,69 @@
 # sequence_viewer/graphics/sequence_item/sequence_item.py
 # graphics/sequence_item/sequence_item.py
 from typing import Optional
+from collections import OrderedDict
 import weakref
 from PyQt5.QtCore import Qt, QRectF, QPointF
-from PyQt5.QtGui import QPainter, QFont, QColor, QPen, QBrush
+from PyQt5.QtGui import QPainter, QFont, QColor, QPen, QBrush, QPixmap
 from PyQt5.QtWidgets import QGraphicsItem
 import math
+import numpy as np
+from sequence_viewer.graphics import font_registry
 from sequence_viewer.graphics.sequence_item.sequence_glyph_cache import default_nucleotide_color_map, GLYPH_CACHE
 from sequence_viewer.graphics.sequence_item.sequence_item_model import SequenceItemModel
 from settings.sequence_viewer.theme import theme_manager
 from settings.sequence_viewer.display_settings_manager import display_settings_manager
 
+def _color_runs(idx, x0, cw):
+    """idx (uint8 brush indeksleri) → [(ci, xs, ws), ...]; ardışık eşit indeksler tek koşu olur.
+    Koşu sınırları, x/genişlik ve renge göre gruplama NumPy'da yapılır; Python'a yalnızca
+    renk başına iki float listesi döner."""
+    n = idx.shape[0]
+    starts = np.flatnonzero(idx[1:] != idx[:-1]) + 1
+    lo = np.concatenate(([0], starts))
+    hi = np.concatenate((starts, [n]))
+    colors = idx[lo]
+    xs = x0 + lo * cw
+    ws = (hi - lo) * cw
+    order = np.argsort(colors, kind="stable")
+    colors = colors[order]; xs = xs[order]; ws = ws[order]
+    bounds = np.flatnonzero(colors[1:] != colors[:-1]) + 1
+    out = []
+    for a, b in zip(np.concatenate(([0], bounds)).tolist(), np.concatenate((bounds, [colors.shape[0]])).tolist()):
+        out.append((int(colors[a]), xs[a:b].tolist(), ws[a:b].tolist()))
+    return out
+
+
 class SequenceGraphicsItem(QGraphicsItem):
     TEXT_MODE = SequenceItemModel.TEXT_MODE
     BOX_MODE = SequenceItemModel.BOX_MODE
     LINE_MODE = SequenceItemModel.LINE_MODE
+    # TEXT_MODE satır strip cache'i: sütun blokları tek pixmap'e önceden basılır
+    _STRIP_COLS = 128
+    _STRIP_MAX = 4
+    _STRIP_MAX_PX = 4096  # strip başına cihaz pikseli üst sınırı; yüksek zoom'da sütun sayısı düşer
+    _WARM_ALPHABET = "ACGTUN-"
 
     def __init__(self, sequence, char_width=12.0, char_height=18.0, row_index=0, color_map=None, base_char_width=None, parent=None):
         super().__init__(parent)
         self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        # Kaydırmada yeniden rasterize etmeyi önler; zoom animasyonunda view NoCache'e alır
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.row_index = row_index
         self._row_highlighted = False
+        # View drawBackground satır bantlarını zaten boyuyorsa False yapılır
+        self.draw_row_background = True
         self._model = SequenceItemModel(sequence=sequence, char_width=char_width, char_height=char_height, color_map=color_map, base_char_width=base_char_width)
-        self.font = QFont(display_settings_manager.sequence_font_family)
-        self.font.setStyleHint(QFont.Monospace)
-        self.font.setFixedPitch(True)
+        self._font_family = display_settings_manager.sequence_font_family
+        # Paylaşımlı (font_registry); yerinde değiştirilmez, boyut değişince yeniden alınır
+        self.font = font_registry.get_font(self._font_family, QFont.Monospace, float(self._model.current_font_size))
         self._applied_font_size = -1.0
+        self._bounding_rect = QRectF()  # geometri değiştiren her yolda _update_bounds ile yenilenir
+        self._update_bounds()
+        self._strips: "OrderedDict[int, QPixmap]" = OrderedDict()
+        self._strip_key = None
+        self._strip_cols = self._STRIP_COLS  # geçerli anahtar için strip başına sütun
+        self._strip_dpr = 1.0
         self._sync_font_from_model()
         _ref = weakref.ref(self)
         theme_manager.themeChanged.connect(lambda _, r=_ref: (s := r()) and s.update())
@@ -49,11 +87,22 @@ class SequenceGraphicsItem(QGraphicsItem):
     @property
     def selection_range(self): return self._model.selection_range
 
+    def set_sequence(self, sequence):
+        """Pool remount: diziyi değiştirir (caller prepareGeometryChange çağırmış olmalı)."""
+        self._model.sequence = sequence
+        self._model.length = len(sequence)
+        self._update_bounds()
+
+    def _update_bounds(self):
+        model = self._model
+        self._bounding_rect = QRectF(0, 0, model.char_width * model.length, model.char_height)
+
     def set_char_width(self, new_width):
         if new_width <= 0: new_width = 0.001
         if abs(new_width - self.char_width) < 0.0001: return
         self.prepareGeometryChange()
         self._model.set_char_width(new_width)
+        self._update_bounds()
         self._sync_font_from_model()
         self.update()
 
@@ -63,14 +112,16 @@ class SequenceGraphicsItem(QGraphicsItem):
         if new_width <= 0: new_width = 0.001
         if abs(new_width - self.char_width) < 0.0001: return
         self._model.set_char_width(new_width)
+        self._update_bounds()
         self._sync_font_from_model()
 
+    # DeviceCoordinateCache: seçim aynı kaldıysa update() yok, cache'li pixmap korunur
     def set_selection(self, start_col, end_col):
-        self._model.set_selection(start_col, end_col); self.update()
+        if self._model.set_selection(start_col, end_col): self.update()
     def set_multi_selection(self, ranges):
-        self._model.set_multi_selection(ranges); self.update()
+        if self._model.set_multi_selection(ranges): self.update()
     def clear_selection(self):
-        self._model.clear_selection(); self.update()
+        if self._model.clear_selection(): self.update()
     def set_row_highlighted(self, highlighted):
         highlighted = bool(highlighted)
         if self._row_highlighted == highlighted: return
@@ -80,11 +131,12 @@ class SequenceGraphicsItem(QGraphicsItem):
         self._model.set_lod_max_mode(mode); self.update()
 
     def refresh_display_settings(self):
-        self.font.setFamily(display_settings_manager.sequence_font_family)
+        self._font_family = display_settings_manager.sequence_font_family
         new_ch = display_settings_manager.sequence_char_height
         if self._model.char_height != new_ch:
             self.prepareGeometryChange()
             self._model.set_char_height(new_ch)
+            self._update_bounds()
         else:
             self._model._update_display_state()
         self._applied_font_size = -1.0
@@ -92,16 +144,79 @@ class SequenceGraphicsItem(QGraphicsItem):
         self.update()
 
     def _on_color_styles_changed(self):
-        self._model.refresh_color_map(); self.update()
+        self._model.refresh_color_map(); self._invalidate_strips(); self.update()
 
     def _sync_font_from_model(self):
         desired = float(self._model.current_font_size)
         if abs(desired - self._applied_font_size) < 0.001: return
-        self.font.setPointSizeF(desired)
+        self.font = font_registry.get_font(self._font_family, QFont.Monospace, desired)
         self._applied_font_size = desired
+        self._invalidate_strips()
+        if self._model.display_mode == SequenceItemModel.TEXT_MODE:
+            # Zoom snap sonrası ilk paint'in glyph miss'lerini önle (seçim için beyaz dahil)
+            GLYPH_CACHE.warm(self.font, self._WARM_ALPHABET, self._model.color_map, QColor(50, 50, 50), (QColor(255, 255, 255),))
+
+    def _invalidate_strips(self):
+        self._strips.clear(); self._strip_key = None
+
+    def _strips_usable(self, cw, char_h, dpr):
+        """Strip'ler yalnızca aynı anahtarla ikinci paint'ten itibaren kullanılır;
+        zoom animasyonu gibi her frame'de değişen char_width için strip inşa edilmez."""
+        model = self._model
+        key = (model.sequence, model.color_map, cw, char_h, self._applied_font_size, dpr)
+        old = self._strip_key
+        if (old is not None and old[0] is key[0] and old[1] is key[1] and old[2:] == key[2:]):
+            return True
+        self._strips.clear(); self._strip_key = key
+        # Strip genişliği piksel bütçesiyle sınırlı: sütun sayısı cw * dpr'ye göre
+        self._strip_cols = max(1, min(self._STRIP_COLS, int(self._STRIP_MAX_PX // max(cw * dpr, 0.001))))
+        self._strip_dpr = dpr
+        return False
+
+    def _get_strip(self, chunk, cw, char_h):
+        strips = self._strips
+        pm = strips.get(chunk)
+        if pm is not None:
+            strips.move_to_end(chunk)
+            return pm
+        model = self._model
+        cols = self._strip_cols; dpr = self._strip_dpr
+        lo = chunk * cols
+        hi = min(model.length, lo + cols)
+        text = model.sequence[lo:hi]
+        # Cihaz pikselinde kurulur; HiDPI'da blit ölçeklenmez
+        pm = QPixmap(max(1, math.ceil((hi - lo) * cw * dpr)), max(1, math.ceil(int(char_h) * dpr)))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        self._draw_glyphs(p, text, 0, hi - lo, 0.0, cw, char_h, False, {})
+        p.end()
+        strips[chunk] = pm
+        if len(strips) > self._STRIP_MAX: strips.popitem(last=False)
+        return pm
+
+    def _draw_glyphs(self, painter, text, j0, j1, x0, cw, char_h, selected, local):
+        """text[j0:j1] glyph'lerini x0 + j*cw konumuna basar; local tek karakterlik glyph dict'idir."""
+        color_map = self._model.color_map
+        _fallback = QColor(50, 50, 50)
+        _white = QColor(255, 255, 255)
+        subcache = GLYPH_CACHE.get_subcache(GLYPH_CACHE.font_key(self.font))
+        dy = None
+        for j in range(j0, j1):
+            base_char = text[j]
+            pm = local.get(base_char)
+            if pm is None:
+                # Büyük harfe çevirme yalnızca yerel glyph miss'inde (karakter başına bir kez)
+                col = _white if selected else color_map.get(base_char.upper(), _fallback)
+                pm = GLYPH_CACHE.get_glyph(base_char, self.font, col, subcache)
+                local[base_char] = pm
+            # dy is identical for every glyph at a given font size; compute once
+            if dy is None:
+                dy = (char_h - pm.height()) / 2.0
+            painter.drawPixmap(QPointF(x0 + j * cw + (cw - pm.width()) / 2.0, dy), pm)
 
     def boundingRect(self):
-        return QRectF(0, 0, self.char_width * self.length, self.char_height)
+        return self._bounding_rect
 
     def paint(self, painter, option, widget=None):
         if option is None or option.exposedRect.isNull(): return
@@ -113,48 +228,48 @@ class SequenceGraphicsItem(QGraphicsItem):
         length = model.length
         t = theme_manager.current
 
-        painter.save()
+        # save()/restore() yok: view her item etrafında painter durumunu korur; paint
+        # ihtiyaç duyduğu pen/brush/font'u kendisi ayarlar.
 
         # Row background — one drawRect, no per-char work
         painter.setPen(Qt.NoPen)
-        if self._row_highlighted:
-            painter.setBrush(QBrush(QColor(t.row_band_highlight)))
-        else:
-            painter.setBrush(QBrush(t.row_bg_even if self.row_index % 2 == 0 else t.row_bg_odd))
-        painter.drawRect(exposed)
-
-        total_width = length * cw
-        vis_left = max(exposed.left(), 0.0)
-        vis_right = min(exposed.right(), total_width)
-        if vis_right <= vis_left:
-            painter.restore()
+        if self.draw_row_background:
+            if self._row_highlighted:
+                painter.setBrush(QBrush(QColor(t.row_band_highlight)))
+            else:
+                painter.setBrush(QBrush(t.row_bg_even if self.row_index % 2 == 0 else t.row_bg_odd))
+            painter.drawRect(exposed)
+
+        # Exposed alanı item sınırına tek C++ çağrısıyla kırp
+        clip = exposed.intersected(QRectF(0.0, 0.0, length * cw, char_h))
+        if clip.isEmpty():
             return
+        vis_left = clip.left()
+        vis_right = clip.right()
 
-        start_idx = max(0, math.floor(vis_left / cw))
-        end_idx   = min(length, math.ceil(vis_right / cw))
+        start_idx = int(vis_left // cw)
+        end_idx   = min(length, int(-(-vis_right // cw)))
         vis_len   = end_idx - start_idx
 
         sel_ranges     = model._selection_ranges
-        effective_mode = model.get_effective_mode()
+        effective_mode = model.effective_mode_for_lod(option.levelOfDetailFromTransform(painter.worldTransform()))
 
         if effective_mode == SequenceItemModel.LINE_MODE:
             line_h = model.line_height
             y = (char_h - line_h) / 2.0
-            painter.setBrush(QBrush(t.seq_line_fg))
-            painter.drawRect(QRectF(vis_left, y, vis_right - vis_left, line_h))
+            # fillRect: pen/brush state değişimi olmadan doğrudan solid fill
+            painter.fillRect(QRectF(vis_left, y, vis_right - vis_left, line_h), t.seq_line_fg)
             if sel_ranges:
-                painter.setBrush(QBrush(QColor(t.seq_selection_bg)))
+                sel_color = QColor(t.seq_selection_bg)
                 for s, e in sel_ranges:
                     sx = max(s * cw, vis_left); ex = min(e * cw, vis_right)
                     if ex > sx:
-                        painter.drawRect(QRectF(sx, 0.0, ex - sx, char_h))
-            painter.restore()
+                        painter.fillRect(QRectF(sx, 0.0, ex - sx, char_h), sel_color)
             return
 
         # Decode only the visible column slice — for LazySequence this calls decode_range(),
         # for plain str it is an O(vis_len) slice copy. Either way _vis is a plain str.
         _vis = model.sequence[start_idx:end_idx]
-        _vis_upper = _vis.upper()
 
         # --- Selection: build O(vis_len) mask and draw one rect per range ---
         # Replaces O(vis_len * n_ranges) any() check and per-character drawRect.
@@ -169,65 +284,65 @@ class SequenceGraphicsItem(QGraphicsItem):
                     sel_mask[lo - start_idx : hi - start_idx] = b'\x01' * (hi - lo)
                     painter.drawRect(QRectF(lo * cw, 0.0, (hi - lo) * cw, char_h))
 
-        color_map = model.color_map
-        _fallback = QColor(50, 50, 50)
-
         if effective_mode == SequenceItemModel.TEXT_MODE:
             painter.setFont(self.font)
             painter.setPen(Qt.NoPen)
             painter.setBrush(Qt.NoBrush)
-            _white = QColor(255, 255, 255)
-
-            # Local glyph dicts use a single-char key instead of the 8-tuple
-            # GLYPH_CACHE key — O(1) hits after the first encounter per base.
-            # For ATGCN: ≤5 GLYPH_CACHE calls total per paint, rest are local hits.
-            _local_normal: dict = {}
-            _local_sel: dict = {}
-            dy = 0.0
-
-            for j in range(vis_len):
-                base_char = _vis[j]
-                base_u    = _vis_upper[j]
-
-                if sel_mask is not None and sel_mask[j]:
-                    pm = _local_sel.get(base_char)
-                    if pm is None:
-                        pm = GLYPH_CACHE.get_glyph(base_char, self.font, _white)
-                        _local_sel[base_char] = pm
-                else:
-                    pm = _local_normal.get(base_char)
-                    if pm is None:
-                        col = color_map.get(base_u, _fallback)
-                        pm  = GLYPH_CACHE.get_glyph(base_char, self.font, col)
-                        _local_normal[base_char] = pm
-
-                # dy is identical for every glyph at a given font size; compute once
-                if not dy:
-                    dy = (char_h - pm.height()) / 2.0
-
-                x = (start_idx + j) * cw
-                painter.drawPixmap(QPointF(x + (cw - pm.width()) / 2.0, dy), pm)
+            x0 = start_idx * cw
+
+            # Seçili sütunlar beyaz glyph ile tek tek basılır; kalanlar sel_mask'taki
+            # 0-koşuları olarak strip blit'i (ya da ilk paint'te doğrudan glyph) alır.
+            if sel_mask is None:
+                plain_runs = [(0, vis_len)]
+            else:
+                plain_runs = []
+                pos = 0
+                while pos < vis_len:
+                    lo = sel_mask.find(0, pos)
+                    if lo < 0: break
+                    hi = sel_mask.find(1, lo)
+                    if hi < 0: hi = vis_len
+                    plain_runs.append((lo, hi))
+                    pos = hi
+
+            device = painter.device()
+            dpr = device.devicePixelRatioF() if device is not None else 1.0
+            if self._strips_usable(cw, char_h, dpr):
+                C = self._strip_cols
+                for lo, hi in plain_runs:
+                    a = start_idx + lo; b = start_idx + hi
+                    for chunk in range(a // C, (b - 1) // C + 1):
+                        ca = max(a, chunk * C); cb = min(b, chunk * C + C)
+                        strip = self._get_strip(chunk, cw, char_h)
+                        w = (cb - ca) * cw
+                        # Kaynak rect pixmap'in cihaz pikselinde
+                        painter.drawPixmap(QRectF(ca * cw, 0.0, w, char_h), strip,
+                                           QRectF((ca - chunk * C) * cw * dpr, 0.0, w * dpr, char_h * dpr))
+            else:
+                _local_normal: dict = {}
+                for lo, hi in plain_runs:
+                    self._draw_glyphs(painter, _vis, lo, hi, x0, cw, char_h, False, _local_normal)
+
+            if sel_mask is not None:
+                _local_sel: dict = {}
+                pos = 0
+                while pos < vis_len:
+                    lo = sel_mask.find(1, pos)
+                    if lo < 0: break
+                    hi = sel_mask.find(0, lo)
+                    if hi < 0: hi = vis_len
+                    self._draw_glyphs(painter, _vis, lo, hi, x0, cw, char_h, True, _local_sel)
+                    pos = hi
 
         elif effective_mode == SequenceItemModel.BOX_MODE:
             box_h = model.box_height
             y = (char_h - box_h) / 2.0
             painter.setPen(Qt.NoPen)
 
-            # Group x-positions by color → ≤5 setBrush calls for ATGCN instead of one per char
-            buckets: dict = {}  # (r,g,b) -> [QColor, [x, ...]]
-            for j in range(vis_len):
-                base_u = _vis_upper[j]
-                color  = color_map.get(base_u, _fallback)
-                rgb    = (color.red(), color.green(), color.blue())
-                entry  = buckets.get(rgb)
-                if entry is None:
-                    buckets[rgb] = [color, [(start_idx + j) * cw]]
-                else:
-                    entry[1].append((start_idx + j) * cw)
-
-            for _rgb, (color, xs) in buckets.items():
-                painter.setBrush(QBrush(color))
-                for x in xs:
-                    painter.drawRect(QRectF(x, y, cw, box_h))
-
-        painter.restore()
+            # byte → brush indeksi tek vektörel gather; aynı renkli komşu sütunlar tek
+            # rect'e birleşir ve her renk tek drawRects çağrısıyla basılır.
+            lut, brushes = model.color_lut()
+            idx = lut[np.frombuffer(_vis.encode('latin-1', 'replace'), dtype=np.uint8)]
+            for ci, xs, ws in _color_runs(idx, start_idx * cw, cw):
+                painter.setBrush(brushes[ci])
+                painter.drawRects([QRectF(x, y, w, box_h) for x, w in zip(xs, ws)])
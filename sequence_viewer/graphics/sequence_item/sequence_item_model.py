@@ -1,16 +1,29 @@
 # sequence_viewer/graphics/sequence_item/sequence_item_model.py
 # graphics/sequence_item/sequence_item_model.py
 from typing import Optional, Tuple, Dict
-from PyQt5.QtGui import QColor
-from sequence_viewer.graphics.sequence_item.sequence_glyph_cache import default_nucleotide_color_map
+from bisect import bisect_right
+from collections import OrderedDict
+import numpy as np
+from PyQt5.QtGui import QBrush, QColor
+from sequence_viewer.graphics.sequence_item.sequence_glyph_cache import shared_default_color_map
 from settings.sequence_viewer.display_settings_manager import display_settings_manager
 
+# scale eşikleri → sequence_font_size_base çarpanı (0: eşik altı, base_font_size * scale'e düşer)
+_SCALE_THRESHOLDS = (0.25, 0.45, 0.7, 1.2, 1.8)
+_SNAP_FACTORS = (None, 4.0 / 12.0, 6.0 / 12.0, 8.0 / 12.0, 10.0 / 12.0, 1.0)
+
 class SequenceItemModel:
     TEXT_MODE = "text"
     BOX_MODE = "box"
     LINE_MODE = "line"
     _TEXT_BOX_THRESHOLD = 8.0
     _BOX_LINE_THRESHOLD = 5.0
+    _MODES_BY_SIZE = (LINE_MODE, BOX_MODE, TEXT_MODE)
+    # (char_width, default_char_width, char_height, font_size_base) → (font, mode, box_h, line_h);
+    # aynı zoom adımında tüm satırlar tek hesabı paylaşır
+    _DISPLAY_STATE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _DISPLAY_STATE_CACHE_MAX = 64
+    _shared_color_lut = None  # paylaşımlı varsayılan harita için son kurulan (color_map, lut, brushes)
 
     def __init__(self, sequence, char_width=12.0, char_height=18.0, color_map=None, base_char_width=None):
         self.sequence = sequence
@@ -18,7 +31,7 @@ class SequenceItemModel:
         self.char_width = max(char_width, 0.001)
         self.char_height = max(1, int(round(char_height)))
         self._custom_color_map = color_map is not None
-        self.color_map = color_map or default_nucleotide_color_map()
+        self.color_map = color_map or shared_default_color_map()
         # Use the view’s initial (unzoomed) char_width as the LOD reference so that
         # items created at a zoomed-out level correctly inherit the current display mode.
         ref_cw = float(base_char_width) if base_char_width is not None else self.char_width
@@ -30,11 +43,37 @@ class SequenceItemModel:
         self.box_height = self.char_height * 0.7
         self.line_height = self.char_height * 0.3
         self._lod_max_mode = None
+        self.effective_mode = self.TEXT_MODE  # display_mode ∘ lod_max_mode; paint bunu okur
+        self._color_lut = None  # (color_map, lut, brushes) — color_map değişince yeniden kurulur
         self._update_display_state()
 
     def refresh_color_map(self):
         if not self._custom_color_map:
-            self.color_map = default_nucleotide_color_map()
+            self.color_map = shared_default_color_map()
+
+    def color_lut(self):
+        """(lut, brushes): lut[byte] → brush indeksi (uint8, 256 giriş); aynı RGB tek QBrush'a iner.
+        Arama paint'teki gibi büyük harfle yapılır; eşlenmeyen byte'lar fallback rengine düşer.
+        Brush'lar burada bir kez kurulur; paint yolunda QColor/QBrush inşası olmaz."""
+        cached = self._color_lut
+        if cached is not None and cached[0] is self.color_map: return cached[1], cached[2]
+        shared = SequenceItemModel._shared_color_lut
+        if shared is not None and shared[0] is self.color_map:
+            self._color_lut = shared; return shared[1], shared[2]
+        color_map = self.color_map
+        fallback = QColor(50, 50, 50)
+        palette = []; by_rgb = {}
+        lut = np.empty(256, dtype=np.uint8)
+        for b in range(256):
+            color = color_map.get(chr(b).upper(), fallback)
+            rgb = (color.red(), color.green(), color.blue())
+            i = by_rgb.get(rgb)
+            if i is None:
+                i = by_rgb[rgb] = len(palette); palette.append(color)
+            lut[b] = i
+        brushes = [QBrush(c) for c in palette]
+        self._color_lut = SequenceItemModel._shared_color_lut = (color_map, lut, brushes)
+        return lut, brushes
 
     def set_char_width(self, new_width):
         self.char_width = max(new_width, 0.001)
@@ -49,25 +88,31 @@ class SequenceItemModel:
 
     def _update_display_state(self):
         if self.default_char_width <= 0: self.default_char_width = 12.0
+        max_fs = display_settings_manager.sequence_font_size_base
+        key = (self.char_width, self.default_char_width, self.char_height, max_fs)
+        cache = SequenceItemModel._DISPLAY_STATE_CACHE
+        state = cache.get(key)
+        if state is None:
+            state = cache[key] = self._compute_display_state(max_fs)
+            if len(cache) > self._DISPLAY_STATE_CACHE_MAX: cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        self.current_font_size, self.display_mode, self.box_height, self.line_height = state
+        self._refresh_effective_mode()
+
+    def _compute_display_state(self, max_fs):
         cw = max(self.char_width, 0.001)
         base_cw = max(self.default_char_width, 0.001)
         scale = cw / base_cw
-        max_fs = display_settings_manager.sequence_font_size_base
-        if scale >= 1.8: snapped_size = max_fs
-        elif scale >= 1.2: snapped_size = max(1.0, max_fs * (10.0 / 12.0))
-        elif scale >= 0.7: snapped_size = max(1.0, max_fs * (8.0 / 12.0))
-        elif scale >= 0.45: snapped_size = max(1.0, max_fs * (6.0 / 12.0))
-        elif scale >= 0.25: snapped_size = max(1.0, max_fs * (4.0 / 12.0))
+        idx = bisect_right(_SCALE_THRESHOLDS, scale)
+        if idx == len(_SNAP_FACTORS) - 1: snapped_size = max_fs
+        elif idx: snapped_size = max(1.0, max_fs * _SNAP_FACTORS[idx])
         else: snapped_size = max(1.0, self.base_font_size * scale)
-        self.current_font_size = snapped_size
-        text_box_threshold = max_fs * (7.0 / 11.0)
-        box_line_threshold = max_fs * (3.5 / 11.0)
-        if self.current_font_size >= text_box_threshold: self.display_mode = self.TEXT_MODE
-        elif self.current_font_size >= box_line_threshold: self.display_mode = self.BOX_MODE
-        else: self.display_mode = self.LINE_MODE
-        box_ref = min(self.char_height * 0.7, self.current_font_size)
-        self.box_height = max(box_ref, 1.0)
-        self.line_height = max(1.0, min(self.char_height * 0.7, max_fs * (4.0 / 12.0)))
+        # (box_line, text_box) eşikleri üzerinde bisect: 0 → LINE, 1 → BOX, 2 → TEXT
+        mode_idx = bisect_right((max_fs * (3.5 / 11.0), max_fs * (7.0 / 11.0)), snapped_size)
+        box_height = max(min(self.char_height * 0.7, snapped_size), 1.0)
+        line_height = max(1.0, min(self.char_height * 0.7, max_fs * (4.0 / 12.0)))
+        return snapped_size, self._MODES_BY_SIZE[mode_idx], box_height, line_height
 
     @property
     def selection_range(self):
@@ -77,7 +122,7 @@ class SequenceItemModel:
     def set_selection(self, start_col, end_col):
         start = max(0, min(start_col, end_col))
         end = min(self.length, max(start_col, end_col) + 1)
-        self._selection_ranges = [(start, end)] if start < end else []
+        return self._assign_selection([(start, end)] if start < end else [])
 
     def set_multi_selection(self, ranges):
         """[(start_col, end_col), ...] â€” her aralık baĞŸımsız, aralarındaki boşluk seçilmez."""
@@ -87,10 +132,16 @@ class SequenceItemModel:
             end = min(self.length, max(start_col, end_col) + 1)
             if start < end:
                 result.append((start, end))
-        self._selection_ranges = result
+        return self._assign_selection(result)
 
     def clear_selection(self):
-        self._selection_ranges = []
+        return self._assign_selection([])
+
+    def _assign_selection(self, ranges):
+        """Aralıkları ata; değiştiyse True — görünüm yalnızca değişen satırları yeniden çizer."""
+        if ranges == self._selection_ranges: return False
+        self._selection_ranges = ranges
+        return True
 
     @staticmethod
     def _mode_order(mode):
@@ -101,11 +152,25 @@ class SequenceItemModel:
     def set_lod_max_mode(self, mode):
         if mode not in (None, self.TEXT_MODE, self.BOX_MODE, self.LINE_MODE): return
         self._lod_max_mode = mode
+        self._refresh_effective_mode()
 
-    def get_effective_mode(self):
+    def _refresh_effective_mode(self):
         base_mode = self.display_mode
-        if self._lod_max_mode is None: return base_mode
-        if self._mode_order(base_mode) < self._mode_order(self._lod_max_mode): return self._lod_max_mode
-        return base_mode
+        lod = self._lod_max_mode
+        if lod is not None and self._mode_order(base_mode) < self._mode_order(lod): base_mode = lod
+        self.effective_mode = base_mode
+
+    def get_effective_mode(self):
+        return self.effective_mode
+
+    def effective_mode_for_lod(self, lod):
+        """View transform'u ölçekliyse (lod < 1) modu cihaz pikselindeki sütun genişliğine göre düşürür;
+        font snap'i eski kalsa bile alt-piksel sütunlar LINE_MODE'un tek fillRect'ine iner."""
+        mode = self.effective_mode
+        if lod >= 1.0: return mode
+        device_cw = self.char_width * lod
+        if device_cw < self._BOX_LINE_THRESHOLD: return self.LINE_MODE
+        if device_cw < self._TEXT_BOX_THRESHOLD and mode == self.TEXT_MODE: return self.BOX_MODE
+        return mode
 
 
@@ -1,6 +1,7 @@
 # sequence_viewer/model/consensus_calculator.py
 from __future__ import annotations
 
+import sys
 from enum import Enum, auto
 
 import numpy as np
@@ -40,20 +41,20 @@ class ConsensusCalculator:
     def compute(self, sequences) -> str:
         if not sequences:
             return ""
-        max_len = max(len(s) for s in sequences)
-        if max_len == 0:
-            return ""
-        return self.compute_range(sequences, 0, max_len)
+        # compute_range clamps col_end to the longest row; no separate length pass here.
+        return self.compute_range(sequences, 0, sys.maxsize)
 
     def compute_range(self, sequences, col_start: int, col_end: int) -> str:
         """Compute consensus for columns [col_start, col_end) only."""
         if not sequences or col_start >= col_end:
             return ""
-        max_len = max(len(s) for s in sequences)
+        # One pass over the row lengths gives both the width and the equal-length check.
+        lengths = list(map(len, sequences))
+        max_len = max(lengths)
         col_end = min(col_end, max_len)
         if col_start >= col_end:
             return ""
-        arr = self._build_arr(sequences, max_len)
+        arr = self._build_arr(sequences, max_len, min(lengths) == max_len)
         if col_start > 0 or col_end < max_len:
             arr = arr[:, col_start:col_end]
         if self.method == ConsensusMethod.PLURALITY:
@@ -63,10 +64,10 @@ class ConsensusCalculator:
     # ── numpy helpers ────────────────────────────────────────────────────
 
     @staticmethod
-    def _build_arr(sequences, max_len: int) -> np.ndarray:
+    def _build_arr(sequences, max_len: int, uniform: bool) -> np.ndarray:
         n = len(sequences)
         # Fast path: all sequences same length (typical for aligned data)
-        if all(len(s) == max_len for s in sequences):
+        if uniform:
             combined = "".join(sequences)
             arr = (
                 np.frombuffer(combined.encode("latin-1"), dtype=np.uint8)
@@ -7,22 +7,10 @@ class SequenceDataModel:
         self.sequences: List[Tuple[str, str]] = []
 
     def load_fasta(self, file_path):
-        self.sequences.clear()
-        header = None
-        seq_chunks = []
+        # SimpleFastaParser: SeqRecord/Seq kurmadan (başlık, dizi) çiftleri
+        from Bio.SeqIO.FastaIO import SimpleFastaParser
         with open(file_path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line: continue
-                if line.startswith(">"):
-                    if header is not None:
-                        self.sequences.append((header, "".join(seq_chunks)))
-                    header = line[1:].strip()
-                    seq_chunks = []
-                else:
-                    seq_chunks.append(line)
-        if header is not None:
-            self.sequences.append((header, "".join(seq_chunks)))
+            self.sequences = [(title.strip(), seq) for title, seq in SimpleFastaParser(handle)]
 
     def add_sequence(self, header, sequence):
         self.sequences.append((header, sequence))
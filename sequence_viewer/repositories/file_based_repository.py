@@ -1,26 +1,53 @@
 # sequence_viewer/repositories/file_based_repository.py
 # repositories/file_based_repository.py
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Mapping, Iterable
 from .base_repository import AbstractSequenceRepository
 
 class FileSequenceRecord:
+    __slots__ = ("id", "sequence")  # kayıt başına __dict__ yok
     def __init__(self, record_id, sequence): self.id = record_id; self.sequence = sequence
 
+@lru_cache(maxsize=8)
+def _parse_fasta(path_str, mtime_ns, size):
+    """(records, index) — (yol, mtime, boyut) değişmedikçe dosya yeniden ayrıştırılmaz.
+
+    Son 8 dosya tutulur; dosyalar arasında gidip gelmek yeniden ayrıştırmaz. Dönen kayıtlar
+    örnekler arasında paylaşılır; çağıran kayıtları ve index'i kopyalamalıdır (diziler str,
+    paylaşım güvenli).
+    """
+    from Bio.SeqIO.FastaIO import SimpleFastaParser
+    with open(path_str, "r") as fh:
+        # SeqRecord.id ile aynı: başlığın ilk boşluğa kadarki kısmı
+        records = tuple(FileSequenceRecord(t.split(None, 1)[0] if t else "", s) for t, s in SimpleFastaParser(fh))
+    # id → kayıt indeksi; tekrarlanan id'de eski doğrusal taramadaki gibi ilk kayıt kazanır
+    index = {}
+    for i, r in enumerate(records): index.setdefault(r.id, i)
+    return records, index
+
 class FileBasedRepository(AbstractSequenceRepository):
     def __init__(self, fasta_path, feature_path=None):
         self.fasta_path = Path(fasta_path); self.feature_path = Path(feature_path) if feature_path else None
-        self._cache = []; self._load_sequences()
+        self._cache = []; self._index = {}
+        self._load_sequences()
     def _load_sequences(self):
         if not self.fasta_path.exists(): raise FileNotFoundError(f"FASTA path not found: {self.fasta_path}")
-        from Bio import SeqIO
-        self._cache = [FileSequenceRecord(r.id, str(r.seq)) for r in SeqIO.parse(str(self.fasta_path), "fasta")]
+        path = self.fasta_path.resolve(); st = path.stat()
+        records, index = _parse_fasta(str(path), st.st_mtime_ns, st.st_size)
+        # Kayıtlar değiştirilebilir nesneler; örnek başına kopya, paylaşılan cache'e sızmaz
+        self._cache = [FileSequenceRecord(r.id, r.sequence) for r in records]
+        self._index = dict(index)
     def get_sequence_by_id(self, sid):
-        for r in self._cache:
-            if r.id == sid: return r
-        raise KeyError(f"Not found: {sid}")
+        i = self._index.get(sid)
+        if i is None: raise KeyError(f"Not found: {sid}")
+        return self._cache[i]
     def list_sequences(self): return list(self._cache)
     def get_features_in_region(self, sid, start, end): return []
-    def save_sequence(self, seq): pass
+    def save_sequence(self, seq):
+        # Yalnızca bellek içi cache; FASTA dosyasına yazılmaz
+        i = self._index.get(seq.id)
+        if i is None: self._index[seq.id] = len(self._cache); self._cache.append(seq)
+        else: self._cache[i] = seq
 
 
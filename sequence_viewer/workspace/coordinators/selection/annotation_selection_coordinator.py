@@ -111,7 +111,6 @@ class WorkspaceAnnotationSelectionCoordinator:
                 item.set_selection(ranges[0][0], ranges[0][1])
             else:
                 item.set_multi_selection(ranges)
-        ctx.sequence_viewer.scene.invalidate()
         ctx.sequence_viewer.viewport().update()
 
         boundaries: list = []
@@ -49,7 +49,6 @@ class WorkspaceRowSelectionCoordinator:
                             item.set_selection(0, max_len)
                         else:
                             item.clear_selection()
-                ctx.sequence_viewer.scene.invalidate()
                 ctx.sequence_viewer.viewport().update()
 
     def on_seq_row_clicked(self, row_start: int, row_end: int) -> None:
@@ -12,6 +12,7 @@ from settings.bindings.mouse.types import (
     ConsensusSpacerActions,
     HeaderActions,
     MouseAction,
+    MouseBinding,
     MouseContext,
     NavigationRulerActions,
     SequenceActions,
@@ -204,6 +205,9 @@ class MouseBindingManager(BindingManager):
 
     def _load(self):
         self._data = self._config.load()
+        # Parsed bindings per (section, action); None = action is unbound. Hot paths
+        # (wheel, mouse move) then match without re-merging and re-parsing config dicts.
+        self._binding_cache: dict[tuple[str, str], MouseBinding | None] = {}
 
     def _matches_binding(
         self,
@@ -212,12 +216,18 @@ class MouseBindingManager(BindingManager):
         qt_button,
         qt_modifiers,
     ) -> bool:
-        return self._resolver.matches(
-            self._data,
-            self._context_value(section),
-            action_key,
-            qt_button,
-            qt_modifiers,
+        key = (self._context_value(section), action_key)
+        try:
+            binding = self._binding_cache[key]
+        except KeyError:
+            binding = (
+                self._resolver.binding(self._data, *key)
+                if self._resolver.has_binding(self._data, *key)
+                else None
+            )
+            self._binding_cache[key] = binding
+        return binding is not None and self._resolver.binding_matches(
+            binding, qt_button, qt_modifiers
         )
 
     def _context_value(self, section: MouseContext | str) -> str:
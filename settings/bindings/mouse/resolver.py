@@ -43,14 +43,19 @@ class MouseBindingResolver:
         )
 
     def matches(self, data: dict, section: str, action_key: str, qt_button, qt_modifiers) -> bool:
-        if not self._has_binding(data, section, action_key):
+        if not self.has_binding(data, section, action_key):
             return False
+        return self.binding_matches(self.binding(data, section, action_key), qt_button, qt_modifiers)
 
-        binding = self.binding(data, section, action_key)
-        actual_modifiers = self._normalize_modifiers(qt_modifiers)
-        if not self._button_matches(binding.button, qt_button):
+    def binding_matches(self, binding: MouseBinding, qt_button, qt_modifiers) -> bool:
+        if self._normalize_modifiers(qt_modifiers) != binding.modifier:
             return False
-        return actual_modifiers == binding.modifier
+        return self._button_matches(binding.button, qt_button)
+
+    def has_binding(self, data: dict, section: str, action_key: str) -> bool:
+        return (section, action_key) in self._defaults or bool(
+            self.raw_binding(data, section, action_key)
+        )
 
     def _binding_dict(self, data: dict, section: str, action_key: str) -> dict:
         raw = self.raw_binding(data, section, action_key)
@@ -63,11 +68,6 @@ class MouseBindingResolver:
         section_data = data.get(section, {})
         return section_data if isinstance(section_data, dict) else {}
 
-    def _has_binding(self, data: dict, section: str, action_key: str) -> bool:
-        return (section, action_key) in self._defaults or bool(
-            self.raw_binding(data, section, action_key)
-        )
-
     def _normalize_modifiers(self, qt_modifiers) -> int:
         return int(qt_modifiers) & SUPPORTED_MODIFIERS_MASK
 
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QFontMetricsF
+from PyQt5.QtWidgets import QApplication
+
+from sequence_viewer.graphics.header_item.header_item_model import HeaderRowModel
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.parametrize("family,size", [("Arial", 9), ("Arial", 12), ("Courier New", 10)])
+def test_choose_display_text_matches_elided_text(qapp, family, size) -> None:
+    font = QFont(family)
+    font.setPointSizeF(size)
+    metrics = QFontMetricsF(font)
+    rng = random.Random(7)
+    for _ in range(150):
+        text = "".join(rng.choice("ABCxyz_ .|0123456789WMilAV") for _ in range(rng.randint(1, 80)))
+        model = HeaderRowModel(text, 20)
+        for _ in range(20):
+            width = rng.randint(1, 400)
+            expected = text if metrics.horizontalAdvance(text) <= width else metrics.elidedText(text, Qt.ElideRight, width)
+            assert model.choose_display_text(metrics, width) == expected, (text, width)
+
+
+def test_full_width_is_cached_per_metrics_object(qapp) -> None:
+    small = QFont("Arial"); small.setPointSizeF(8)
+    large = QFont("Arial"); large.setPointSizeF(16)
+    small_m, large_m = QFontMetricsF(small), QFontMetricsF(large)
+    model = HeaderRowModel("Homo_sapiens_chromosome_12", 20)
+
+    assert model.full_width(small_m) == small_m.horizontalAdvance(model.full_text)
+    assert model.full_width(large_m) == large_m.horizontalAdvance(model.full_text)
+    model.full_text = "short"
+    assert model.full_width(large_m) == large_m.horizontalAdvance("short")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from sequence_viewer.features.navigation_ruler.navigation_ruler_model import NavigationRulerModel
+
+
+def _reference_step(max_nt: int, pixel_width: int, target_px: int = 60) -> int:
+    raw = (max_nt * target_px) / float(pixel_width)
+    power = 10 ** int(math.floor(math.log10(raw)))
+    base = raw / power
+    nice = 1 if base <= 1 else 2 if base <= 2 else 5 if base <= 5 else 10
+    return int(nice * power)
+
+
+@pytest.mark.parametrize(
+    "max_nt, pixel_width",
+    [(20, 1000), (100, 600), (101, 600), (1_000, 800), (9_999, 800), (123_456, 800),
+     (5_000_000, 1200), (123_456_789, 1920), (10**12, 300)],
+)
+def test_nice_tick_step_matches_log10_decade(max_nt: int, pixel_width: int) -> None:
+    assert NavigationRulerModel._nice_tick_step(max_nt, pixel_width) == _reference_step(max_nt, pixel_width)
+
+
+@pytest.mark.parametrize("max_nt, pixel_width", [(1, 6_000), (5, 600), (10, 600)])
+def test_nice_tick_step_never_rounds_to_zero(max_nt: int, pixel_width: int) -> None:
+    assert NavigationRulerModel._nice_tick_step(max_nt, pixel_width) == 1
+
+    model = NavigationRulerModel()
+    model.recompute_max_len_if_needed(max_nt, 1)
+    layout = model.compute_tick_layout(pixel_width)
+    assert layout.major_ticks[0] == 0 and layout.major_ticks[-1] == max_nt
+
+
+@pytest.mark.parametrize("max_nt, pixel_width, target_px", [(10**9, 800, 1), (50_000, 100, 2), (123_456, 800, 60)])
+def test_minor_ticks_are_at_least_one_pixel_apart(max_nt: int, pixel_width: int, target_px: int) -> None:
+    model = NavigationRulerModel()
+    model.recompute_max_len_if_needed(max_nt, 1)
+    layout = model.compute_tick_layout(pixel_width, target_px=target_px)
+
+    assert len(layout.minor_ticks) <= pixel_width + 1
+    assert layout.minor_x[-1] <= pixel_width
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from sequence_viewer.features.position_ruler.position_ruler_model import PositionRulerModel
+
+
+def _reference_step(visible_span: int) -> int:
+    raw = visible_span / 10.0
+    if raw <= 1:
+        return 1
+    power = 10 ** int(math.floor(math.log10(raw)))
+    base = raw / power
+    nice = 1 if base <= 1.5 else 2 if base <= 3 else 5 if base <= 7 else 10
+    cand = int(nice * power)
+    if visible_span <= 100:
+        cand = min(cand, 10)
+    return max(cand, 1)
+
+
+@pytest.mark.parametrize(
+    "visible_span",
+    [1, 9, 10, 11, 15, 16, 30, 31, 70, 71, 100, 101, 150, 151, 699, 700, 701,
+     1_500, 1_501, 70_000, 70_001, 150_000, 4_000_000, 123_456_789],
+)
+def test_choose_step_matches_log10_rounding(visible_span: int) -> None:
+    model = PositionRulerModel()
+
+    assert model._choose_step(1.0, visible_span) == _reference_step(visible_span)
+
+
+def test_compute_layout_none_for_empty_view() -> None:
+    model = PositionRulerModel()
+    model.set_state(max_len=0, view_left=0.0, view_width=100.0, char_width=10.0, selection_cols=None)
+
+    assert model.compute_layout() is None
+
+
+def test_compute_layout_selection_specials() -> None:
+    model = PositionRulerModel()
+    model.set_state(max_len=1000, view_left=0.0, view_width=500.0, char_width=10.0, selection_cols=(9, 4))
+
+    layout = model.compute_layout()
+
+    assert (layout.first_pos, layout.last_pos, layout.step) == (1, 50, 5)
+    assert layout.special_positions == [5, 10]
+
+
+def test_compute_layout_reuses_result_for_identical_state() -> None:
+    model = PositionRulerModel()
+    state = dict(max_len=1000, view_left=30.0, view_width=500.0, char_width=10.0, selection_cols=[2, 3])
+    model.set_state(**state)
+    first = model.compute_layout()
+    model.set_state(**state)
+
+    assert model.compute_layout() is first
+
+    model.set_state(**{**state, "view_left": 40.0})
+    assert model.compute_layout() is not first
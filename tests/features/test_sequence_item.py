@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import numpy as np
+
+from sequence_viewer.graphics.sequence_item.sequence_item import _color_runs
+from sequence_viewer.graphics.sequence_item.sequence_item_model import SequenceItemModel
+
+
+def test_color_runs_merge_adjacent_columns_and_group_by_color() -> None:
+    idx = np.array([0, 0, 1, 1, 1, 0, 2], dtype=np.uint8)
+
+    runs = _color_runs(idx, 100.0, 10.0)
+
+    assert runs == [
+        (0, [100.0, 150.0], [20.0, 10.0]),
+        (1, [120.0], [30.0]),
+        (2, [160.0], [10.0]),
+    ]
+
+
+def test_color_runs_single_column() -> None:
+    assert _color_runs(np.array([3], dtype=np.uint8), 0.0, 4.0) == [(3, [0.0], [4.0])]
+
+
+def test_effective_mode_for_lod_demotes_on_scaled_view() -> None:
+    model = SequenceItemModel("ACGT" * 10, char_width=12.0, char_height=18.0, base_char_width=12.0)
+    assert model.effective_mode == SequenceItemModel.TEXT_MODE
+
+    assert model.effective_mode_for_lod(1.0) == SequenceItemModel.TEXT_MODE
+    assert model.effective_mode_for_lod(0.6) == SequenceItemModel.BOX_MODE
+    assert model.effective_mode_for_lod(0.04) == SequenceItemModel.LINE_MODE
+
+
+def test_selection_setters_report_whether_ranges_changed() -> None:
+    model = SequenceItemModel("ACGT" * 10)
+
+    assert model.set_selection(2, 5) is True
+    assert model.set_selection(5, 2) is False
+    assert model.set_multi_selection([(2, 5)]) is False
+    assert model.clear_selection() is True
+    assert model.clear_selection() is False
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from sequence_viewer.features.sequence_viewer.sequence_viewer_zoom_controller import (
+    SequenceViewerZoomController,
+)
+from settings.bindings.mouse import mouse_binding_manager
+
+
+def make_controller(min_cw: float = 0.0) -> SequenceViewerZoomController:
+    view = MagicMock()
+    view.compute_min_char_width.return_value = min_cw
+    return SequenceViewerZoomController(MagicMock(), view, MagicMock())
+
+
+@pytest.mark.parametrize("streak_len", [1, 2, 5])
+@pytest.mark.parametrize("steps,direction", [(1.0, 1), (2.5, 1), (1.0, -1), (3.0, -1)])
+def test_target_char_width_matches_power_form(streak_len, steps, direction) -> None:
+    controller = make_controller()
+    controller._state.wheel_zoom_streak_len = streak_len
+
+    per_step = mouse_binding_manager.zoom_base_factor * (
+        mouse_binding_manager.zoom_accel_factor ** max(0, streak_len - 1)
+    )
+    magnitude = per_step ** abs(steps)
+    expected = 10.0 * (magnitude if direction > 0 else 1.0 / magnitude)
+    expected = min(expected, mouse_binding_manager.zoom_max_char_width)
+
+    assert controller._compute_target_char_width(10.0, steps, direction) == pytest.approx(expected)
+
+
+def test_target_char_width_is_clamped_to_bounds() -> None:
+    controller = make_controller(min_cw=5.0)
+    controller._state.wheel_zoom_streak_len = 1
+
+    assert controller._compute_target_char_width(5.0, 10.0, -1) == 5.0
+    assert (
+        controller._compute_target_char_width(1e6, 10.0, 1)
+        == mouse_binding_manager.zoom_max_char_width
+    )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+
+from sequence_viewer.repositories.file_based_repository import FileBasedRepository, FileSequenceRecord
+
+
+@pytest.fixture
+def fasta_path(tmp_path):
+    path = tmp_path / "seqs.fasta"
+    path.write_text(">a first\nACGT\n>b\nGG\nTT\n>a duplicate\nCCCC\n", encoding="utf-8")
+    return path
+
+
+def test_lookup_by_id_returns_first_record_for_duplicate_ids(fasta_path) -> None:
+    repo = FileBasedRepository(fasta_path)
+
+    assert repo.get_sequence_by_id("a").sequence == "ACGT"
+    assert repo.get_sequence_by_id("b").sequence == "GGTT"
+    with pytest.raises(KeyError):
+        repo.get_sequence_by_id("missing")
+
+
+def test_list_sequences_keeps_file_order(fasta_path) -> None:
+    repo = FileBasedRepository(fasta_path)
+
+    listed = repo.list_sequences()
+
+    assert isinstance(listed, list)
+    assert [r.id for r in listed] == ["a", "b", "a"]
+    listed.clear()
+    assert len(repo.list_sequences()) == 3
+
+
+def test_save_sequence_replaces_existing_and_appends_new(fasta_path) -> None:
+    repo = FileBasedRepository(fasta_path)
+
+    repo.save_sequence(FileSequenceRecord("b", "AAAA"))
+    repo.save_sequence(FileSequenceRecord("c", "TTT"))
+
+    assert repo.get_sequence_by_id("b").sequence == "AAAA"
+    assert repo.get_sequence_by_id("c").sequence == "TTT"
+    assert [r.id for r in repo.list_sequences()] == ["a", "b", "a", "c"]
+    assert "AAAA" not in fasta_path.read_text(encoding="utf-8")
+
+
+def test_instances_share_parse_but_not_records(fasta_path) -> None:
+    first = FileBasedRepository(fasta_path)
+    second = FileBasedRepository(fasta_path)
+
+    first.get_sequence_by_id("a").sequence = "MUTATED"
+    first.save_sequence(FileSequenceRecord("b", "AAAA"))
+
+    assert second.get_sequence_by_id("a").sequence == "ACGT"
+    assert second.get_sequence_by_id("b").sequence == "GGTT"
+    assert FileBasedRepository(fasta_path).get_sequence_by_id("a").sequence == "ACGT"
+
+
+def test_rewritten_file_is_reparsed(fasta_path) -> None:
+    import os
+
+    FileBasedRepository(fasta_path)
+    fasta_path.write_text(">z\nAC\n", encoding="utf-8")
+    st = fasta_path.stat()
+    os.utime(fasta_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert [r.id for r in FileBasedRepository(fasta_path).list_sequences()] == ["z"]
+
+
+def test_switching_between_files_reuses_parses(fasta_path, tmp_path) -> None:
+    from sequence_viewer.repositories.file_based_repository import _parse_fasta
+
+    other = tmp_path / "other.fasta"
+    other.write_text(">x\nTTTT\n", encoding="utf-8")
+    FileBasedRepository(fasta_path)
+    FileBasedRepository(other)
+    misses = _parse_fasta.cache_info().misses
+
+    for _ in range(3):
+        assert FileBasedRepository(fasta_path).get_sequence_by_id("a").sequence == "ACGT"
+        assert FileBasedRepository(other).get_sequence_by_id("x").sequence == "TTTT"
+
+    assert _parse_fasta.cache_info().misses == misses
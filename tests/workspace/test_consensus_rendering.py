@@ -52,3 +52,20 @@ def test_consensus_render_uses_visible_slice_without_all_rows() -> None:
 
     alignment_model.all_rows.assert_not_called()
     widget._consensus_slice.assert_called_once_with(0, 80)
+
+
+def test_consensus_box_mode_batches_runs_per_color() -> None:
+    from PyQt5.QtGui import QColor
+
+    widget = MagicMock()
+    widget._color_map = {"A": QColor("red"), "C": QColor("blue")}
+    painter = MagicMock()
+
+    ConsensusRenderer()._render_box_runs(
+        painter, widget, MagicMock(text_primary=QColor("black")), "AAAACCAA", None, 0, 10.0, 0.0, 0.0, 5.0
+    )
+
+    rects = [r for call in painter.drawRects.call_args_list for r in call.args[0]]
+    assert sorted((r.x(), r.width()) for r in rects) == [(0.0, 40.0), (40.0, 20.0), (60.0, 20.0)]
+    assert painter.setBrush.call_count == 2
+    painter.drawRect.assert_not_called()